@@ -12,25 +12,35 @@ from constants import (
     DUE_DATE_REMINDER_LABELS,
     DUE_DATE_REMINDER_MESSAGES,
     DAY_NAME_MAP,
+    DAY_TIME_PATTERN,
     USER_RESPONSE_TIMEOUT,
     RESCHEDULE_TIMEOUT,
-    REMINDER_CHECK_INTERVAL
+    REMINDER_CHECK_INTERVAL,
+    DB_MAINTENANCE_INTERVAL_HOURS
 )
 from database.db_manager import (
-    init_db, get_user_plans_for_week_detailed, get_week_assignments_with_status, 
+    init_db, close_db, run_db_maintenance, get_user_plans_for_week_detailed, get_week_pending_with_status,
     set_assignment_completed, get_pending_reminders, mark_reminder_sent, update_study_plan_time,
     get_pending_due_date_reminders, mark_due_date_reminder_sent, check_week_completion,
     get_week_completion_notified, mark_week_completion_notified
 )
 from utils.weekly import send_weekly_assignments, send_weekly_assignments_to_channel
 from utils.sync import sync_canvas_data
-from utils.datetime_utils import format_local, get_local_tz, to_utc_iso_z
+from utils.datetime_utils import format_local, get_local_tz, to_utc_iso_z, week_start_end_local
 
 # ========================================
 # Bot Initialization
 # ========================================
 
-bot = commands.Bot(command_prefix="!", intents=discord.Intents.all())
+class AssignmentBot(commands.Bot):
+    """Bot that releases the shared database connections on shutdown."""
+
+    async def close(self) -> None:
+        await close_db()
+        await super().close()
+
+
+bot = AssignmentBot(command_prefix="!", intents=discord.Intents.all())
 _synced_once = False
 
 
@@ -40,7 +50,7 @@ _synced_once = False
 
 def parse_day_time_input(input_str: str, week_monday: datetime) -> Optional[str]:
     """Parse user input like 'Wed 7:30 PM' into UTC ISO timestamp."""
-    match = re.match(r"^\s*([A-Za-z]+)\s+(\d{1,2}):(\d{2})\s*([AaPp][Mm])\s*$", input_str)
+    match = DAY_TIME_PATTERN.match(input_str)
     if not match:
         return None
     
@@ -54,9 +64,9 @@ def parse_day_time_input(input_str: str, week_monday: datetime) -> Optional[str]
         hour += 12
     minute = int(mm)
     
-    planned_local = week_monday + timedelta(days=day_idx)
-    planned_local = planned_local.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    planned_local = planned_local.replace(tzinfo=get_local_tz())
+    planned_local = (week_monday + timedelta(days=day_idx)).replace(
+        hour=hour, minute=minute, second=0, microsecond=0, tzinfo=get_local_tz()
+    )
     
     return to_utc_iso_z(planned_local)
 
@@ -92,6 +102,9 @@ async def on_ready() -> None:
         if not check_reminders.is_running():
             check_reminders.start()
             print("⏰ Reminder system started.")
+        
+        if not db_maintenance.is_running():
+            db_maintenance.start()
     except Exception as e:
         print(f"❌ Error during bot initialization: {e}")
 
@@ -122,14 +135,13 @@ async def thisweek(ctx: commands.Context) -> None:
 async def plans(ctx: commands.Context) -> None:
     """Display all planned study sessions for the current week."""
     tz = get_local_tz()
-    today = datetime.now()
-    monday = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=today.weekday())
-    sunday = monday + timedelta(days=6)
+    monday, sunday = week_start_end_local()
 
     user_id = str(ctx.author.id)
     rows = await get_user_plans_for_week_detailed(user_id, monday)
 
-    tz_label = tz.tzname(None) if hasattr(tz, 'tzname') else ''
+    # tzname(None) is None for ZoneInfo zones; ask for the week's abbreviation
+    tz_label = tz.tzname(monday) or ''
     header_range = f"{monday.strftime('%b %d')} – {sunday.strftime('%b %d')} ({tz_label})"
 
     if not rows:
@@ -154,14 +166,11 @@ async def plans(ctx: commands.Context) -> None:
 async def complete(ctx: commands.Context, *, query: Optional[str] = None) -> None:
     """Mark assignments as complete. Optional query to filter assignments."""
     tz = get_local_tz()
-    today = datetime.now()
-    monday = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=today.weekday())
+    monday, _ = week_start_end_local()
 
     user_id = str(ctx.author.id)
-    rows = await get_week_assignments_with_status(user_id, monday)
-
-    # Filter to incomplete assignments only
-    items = [r for r in rows if int(r[6]) == 0]
+    # Incomplete assignments only; submitted ones stay listed with a tag
+    items = await get_week_pending_with_status(user_id, monday, include_submitted=True)
 
     # Apply search query if provided
     if query:
@@ -226,8 +235,7 @@ async def complete(ctx: commands.Context, *, query: Optional[str] = None) -> Non
 async def reschedule(ctx: commands.Context) -> None:
     """Reschedule a planned work session to a new time."""
     tz = get_local_tz()
-    today = datetime.now()
-    monday = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=today.weekday())
+    monday, _ = week_start_end_local()
     
     user_id = str(ctx.author.id)
     rows = await get_user_plans_for_week_detailed(user_id, monday)
@@ -357,6 +365,15 @@ async def check_reminders() -> None:
         print(f"❌ Error checking reminders: {e}")
 
 
+@tasks.loop(hours=DB_MAINTENANCE_INTERVAL_HOURS)
+async def db_maintenance() -> None:
+    """Checkpoint the WAL and refresh query planner statistics."""
+    try:
+        await run_db_maintenance()
+    except Exception as e:
+        print(f"⚠️ Database maintenance failed: {e}")
+
+
 # ========================================
 # Reminder Helper Functions
 # ========================================
@@ -422,13 +439,14 @@ async def check_and_send_completion_notifications(channel: discord.TextChannel)
     if not channel.guild:
         return
     
+    # Same week for every member
+    monday, sunday = week_start_end_local()
+
     for member in channel.guild.members:
         if member.bot:
             continue
         
         user_id = str(member.id)
-        today = datetime.now()
-        monday = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=today.weekday())
         
         # Skip if already notified this week
         if await get_week_completion_notified(user_id, monday):
@@ -438,7 +456,6 @@ async def check_and_send_completion_notifications(channel: discord.TextChannel)
         all_complete, total_count, completed_count = await check_week_completion(user_id, monday)
         
         if all_complete and total_count > 0:
-            sunday = monday + timedelta(days=6)
             week_range = f"{monday.strftime('%b %d')} – {sunday.strftime('%b %d')}"
             
             msg = f"🎉 **Congratulations!** <@{user_id}>\n\n"
@@ -456,4 +473,11 @@ async def check_and_send_completion_notifications(channel: discord.TextChannel)
 # ========================================
 
 if __name__ == "__main__":
+    # Imported here so importing bot (e.g. from tests) never pulls it in
+    try:
+        import uvloop  # faster event loop; not available on Windows
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
     bot.run(BOT_TOKEN)
@@ -1,6 +1,7 @@
 """Canvas API client package for interacting with the Canvas LMS API."""
 
 from .client import CanvasClient
-from .endpoints import get_courses, get_assignments
+from .async_client import AsyncCanvasClient
+from .endpoints import Course, Assignment, get_courses, get_courses_async, get_assignments, get_assignments_async, iter_assignments
 
-__all__ = ['CanvasClient', 'get_courses', 'get_assignments']
+__all__ = ['CanvasClient', 'AsyncCanvasClient', 'Course', 'Assignment', 'get_courses', 'get_courses_async', 'get_assignments', 'get_assignments_async', 'iter_assignments']
@@ -0,0 +1,103 @@
+"""Asynchronous Canvas API client for fetching many endpoints concurrently."""
+
+import aiohttp
+import asyncio
+from typing import Dict, Any, Optional, List, Tuple, Union
+from config import CANVAS_BASE_URL, CANVAS_TOKEN
+from constants import DEFAULT_PER_PAGE, CANVAS_MAX_CONNECTIONS
+from .client import CanvasAPIError, _loads, _next_link
+
+
+class AsyncCanvasClient:
+    """
+    aiohttp-based counterpart to CanvasClient. Use as an async context manager
+    so the pooled connections are closed when the batch of requests is done.
+    Identical GETs made within one 'async with' block share a single fetch.
+    """
+
+    def __init__(self, base_url: str = CANVAS_BASE_URL, token: str = CANVAS_TOKEN) -> None:
+        """Initialize the Canvas API client."""
+        if not base_url or not token:
+            raise ValueError("Canvas API base URL and token are required")
+
+        self.base_url = base_url.rstrip('/')
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (url, params) -> fetch task, so duplicate requests within one batch
+        # (e.g. one sync) hit Canvas once; reset whenever the session is
+        self._requests: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def __aenter__(self) -> "AsyncCanvasClient":
+        self._requests = {}
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(limit=CANVAS_MAX_CONNECTIONS),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        session, self._session = self._session, None
+        self._requests = {}
+        if session is not None:
+            await session.close()
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """Make a GET request to Canvas API with automatic pagination."""
+        if self._session is None:
+            raise RuntimeError("AsyncCanvasClient must be used with 'async with'")
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        # Set default pagination
+        if params is None:
+            params = {"per_page": DEFAULT_PER_PAGE}
+        elif "per_page" not in params:
+            params = {**params, "per_page": DEFAULT_PER_PAGE}
+
+        key = (url, repr(sorted(params.items())))
+        task = self._requests.get(key)
+        if task is None:
+            task = self._requests[key] = asyncio.ensure_future(self._fetch(url, params))
+        try:
+            # Shielded so one cancelled caller does not cancel the shared fetch
+            data = await asyncio.shield(task)
+        except BaseException:
+            # Failed fetches are not remembered; a retry goes back to Canvas
+            if task.done() and self._requests.get(key) is task:
+                del self._requests[key]
+            raise
+        return list(data) if isinstance(data, list) else dict(data)
+
+    async def _fetch(self, url: str, params: Optional[Dict[str, Any]]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """Fetch url and every following page."""
+        all_results: List[Dict[str, Any]] = []
+
+        try:
+            while url:
+                async with self._session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    # Decode the raw bytes ourselves so orjson is used when available
+                    data = _loads(await response.read())
+                    link = response.headers.get('Link', '')
+
+                if isinstance(data, list):
+                    all_results.extend(data)
+                else:
+                    # For non-list responses (single object), return immediately
+                    return data
+
+                url = _next_link(link)
+                params = None  # Only use params on first request
+
+            return all_results
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CanvasAPIError(f"Canvas API request failed: {e}") from e
@@ -1,9 +1,19 @@
 """Canvas API client for making authenticated requests."""
 
+import json
+import re
 import requests
-from typing import Dict, Any, Optional, List, Union
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 from config import CANVAS_BASE_URL, CANVAS_TOKEN
-from constants import DEFAULT_PER_PAGE
+from constants import DEFAULT_PER_PAGE, CANVAS_MAX_CONNECTIONS, CANVAS_ETAG_CACHE_SIZE
+
+try:
+    # Optional, considerably faster decoder for large assignment listings
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class CanvasAPIError(Exception):
@@ -11,6 +21,31 @@ class CanvasAPIError(Exception):
     pass
 
 
+# Tolerates any whitespace between ';' and rel, which the plain substring scan did not
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a raw JSON body with orjson when it is installed."""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a response body, using orjson on the raw bytes when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _next_link(link_header: str) -> Optional[str]:
+    """Return the rel="next" URL from a Link header, or None on the last page."""
+    # Cheap substring check first so the last page never runs the regex
+    if 'rel="next"' not in link_header:
+        return None
+    match = _NEXT_LINK_RE.search(link_header)
+    return match.group(1) if match else None
+
+
 class CanvasClient:
     """Client for interacting with the Canvas LMS API."""
     
@@ -24,6 +59,18 @@ class CanvasClient:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        # One session per client so pages and repeat calls reuse kept-alive
+        # connections; auth headers are set once instead of on every request
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_maxsize=CANVAS_MAX_CONNECTIONS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # (url, params) -> (ETag, raw body) for single-page list responses, so
+        # repeat fetches can be revalidated with If-None-Match. Least recently
+        # used entries are evicted past CANVAS_ETAG_CACHE_SIZE, and the raw
+        # bytes are decoded afresh on a 304 so callers never share objects.
+        self._etag_cache: "OrderedDict[Tuple[str, str], Tuple[str, bytes]]" = OrderedDict()
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Make a GET request to Canvas API with automatic pagination."""
@@ -36,12 +83,27 @@ class CanvasClient:
             params = {**params, "per_page": DEFAULT_PER_PAGE}
         
         all_results: List[Dict[str, Any]] = []
+        cache_key = (url, repr(sorted(params.items())))
+        cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            self._etag_cache.move_to_end(cache_key)
+        headers = None if cached is None else {"If-None-Match": cached[0]}
+        etag = None
+        body = b""
+        pages = 0
         
         try:
             while url:
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
+                response = self._session.get(url, headers=headers, params=params, timeout=30)
+                if cached is not None and response.status_code == 304:
+                    # Unchanged since the last fetch; decode the stored body instead of downloading it
+                    return _loads(cached[1])
                 response.raise_for_status()
-                data = response.json()
+                data = _decode_json(response)
+                pages += 1
+                if pages == 1:
+                    etag = response.headers.get('ETag')
+                    body = response.content
                 
                 if isinstance(data, list):
                     all_results.extend(data)
@@ -49,18 +111,43 @@ class CanvasClient:
                     # For non-list responses (single object), return immediately
                     return data
                 
-                # Parse Link header for pagination
-                link = response.headers.get('Link', '')
-                next_url = None
-                for part in link.split(','):
-                    if 'rel="next"' in part:
-                        next_url = part[part.find('<') + 1:part.find('>')]
-                        break
-                
-                url = next_url
+                url = _next_link(response.headers.get('Link', ''))
                 params = None  # Only use params on first request
+                headers = None  # Only the first page is conditional
             
-            return all_results
+            # A 304 on the first page only proves the whole result is unchanged
+            # when there was no second page
+            if etag and pages == 1:
+                self._etag_cache[cache_key] = (etag, body)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > CANVAS_ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+            else:
+                self._etag_cache.pop(cache_key, None)
+            return list(all_results)
             
         except requests.exceptions.RequestException as e:
-            raise CanvasAPIError(f"Canvas API request failed: {e}") from e
\ No newline at end of file
+            raise CanvasAPIError(f"Canvas API request failed: {e}") from e
+
+    def iter_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items of a paginated list endpoint one page at a time, so
+        only the current page is held in memory. Not ETag-cached.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        params = {"per_page": DEFAULT_PER_PAGE, **(params or {})}
+
+        while url:
+            try:
+                response = self._session.get(url, params=params, timeout=30)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise CanvasAPIError(f"Canvas API request failed: {e}") from e
+            data = _decode_json(response)
+            if not isinstance(data, list):
+                yield data
+                return
+            yield from data
+
+            url = _next_link(response.headers.get('Link', ''))
+            params = None  # Only use params on first request
@@ -1,49 +1,86 @@
 """Canvas API endpoint functions."""
 
 from .client import CanvasClient
-from typing import List, Dict, Any
+from .async_client import AsyncCanvasClient
+from typing import Iterable, Iterator, List, Dict, Any, Optional, TypedDict
 
 canvas_client = CanvasClient()
 
 
-def get_courses() -> List[Dict[str, Any]]:
+class Course(TypedDict):
+    """A course as returned by get_courses()."""
+    id: int
+    name: str
+    course_code: Optional[str]
+    start_at: Optional[str]
+    end_at: Optional[str]
+
+
+class Assignment(TypedDict):
+    """An assignment as returned by get_assignments()."""
+    id: int
+    name: str
+    due_at: Optional[str]
+    html_url: Optional[str]
+    has_submitted_submissions: bool
+
+
+def get_courses() -> List[Course]:
     """Fetch all courses from Canvas for the current user."""
-    data = canvas_client.get("courses")
+    return _normalize_courses(canvas_client.get("courses"))
 
-    valid_courses: List[Dict[str, Any]] = []
-    for course in data:
-        # Skip malformed entries with no name
-        if "name" not in course:
-            continue
 
-        valid_courses.append({
+async def get_courses_async(client: AsyncCanvasClient) -> List[Course]:
+    """Fetch all courses for the current user over a shared async client."""
+    return _normalize_courses(await client.get("courses"))
+
+
+def _normalize_courses(data: List[Dict[str, Any]]) -> List[Course]:
+    """Drop malformed entries and keep only the course fields the bot stores."""
+    # Skip malformed entries with no name
+    return [
+        {
             "id": course["id"],
-            "name": course.get("name"),
+            "name": course["name"],
             "course_code": course.get("course_code"),
             "start_at": course.get("start_at"),
             "end_at": course.get("end_at")
-        })
+        }
+        for course in data
+        if "name" in course
+    ]
 
-    return valid_courses
 
-
-def get_assignments(course_id: int) -> List[Dict[str, Any]]:
+def get_assignments(course_id: int) -> List[Assignment]:
     """Fetch all assignments for a given Canvas course."""
-    data = canvas_client.get(f"courses/{course_id}/assignments")
+    return _normalize_assignments(canvas_client.get(f"courses/{course_id}/assignments"))
+
 
-    valid_assignments: List[Dict[str, Any]] = []
-    for assignment in data:
-        if "id" not in assignment or "name" not in assignment:
-            continue
+def iter_assignments(course_id: int) -> Iterator[Assignment]:
+    """Yield a course's assignments page by page instead of collecting them all first."""
+    return _normalize_assignments_iter(canvas_client.iter_get(f"courses/{course_id}/assignments"))
 
-        valid_assignments.append({
+
+async def get_assignments_async(course_id: int, client: AsyncCanvasClient) -> List[Assignment]:
+    """Fetch all assignments for a given Canvas course over a shared async client."""
+    return _normalize_assignments(await client.get(f"courses/{course_id}/assignments"))
+
+
+def _normalize_assignments(data: List[Dict[str, Any]]) -> List[Assignment]:
+    """Drop malformed entries and keep only the assignment fields the bot stores."""
+    return list(_normalize_assignments_iter(data))
+
+
+def _normalize_assignments_iter(data: Iterable[Dict[str, Any]]) -> Iterator[Assignment]:
+    """Lazy form of _normalize_assignments."""
+    return (
+        {
             "id": assignment["id"],
             "name": assignment["name"],
             "due_at": assignment.get("due_at"),
             "html_url": assignment.get("html_url"),
             "has_submitted_submissions": assignment.get("has_submitted_submissions", False)
-        })
-
-    return valid_assignments
-
-
+        }
+        for assignment in data
+        if "id" in assignment and "name" in assignment
+    )
@@ -1,24 +1,45 @@
 """Configuration management - loads environment variables."""
 
 import os
+from types import SimpleNamespace
+from typing import Mapping
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _load_from_env(env: Mapping[str, str] = os.environ) -> SimpleNamespace:
+    """
+    Build the settings below from an environment mapping. Tests can pass a
+    plain dict instead of patching os.environ and reloading this module.
+    """
+    canvas_token = env.get("CANVAS_TOKEN")
+    return SimpleNamespace(
+        BOT_TOKEN=env.get("BOT_TOKEN"),
+        CHANNEL_ID=env.get("CHANNEL_ID"),
+        CANVAS_TOKEN=canvas_token,
+        CANVAS_BASE_URL=env.get("CANVAS_BASE_URL", "https://canvas.instructure.com/api/v1/"),
+        HEADERS={"Authorization": f"Bearer {canvas_token}"},
+        DB_PATH=env.get("DB_PATH"),
+        WEEKLY_NOTIFICATION_HOUR=int(env.get("WEEKLY_NOTIFICATION_HOUR", "9")),
+        WEEKLY_NOTIFICATION_MINUTE=int(env.get("WEEKLY_NOTIFICATION_MINUTE", "0")),
+    )
+
+
+_settings = _load_from_env()
+
 # Discord Bot Configuration
-BOT_TOKEN = os.getenv("BOT_TOKEN")
-CHANNEL_ID = os.getenv("CHANNEL_ID")
+BOT_TOKEN = _settings.BOT_TOKEN
+CHANNEL_ID = _settings.CHANNEL_ID
 
 # Canvas API Configuration
-CANVAS_TOKEN = os.getenv("CANVAS_TOKEN")
-CANVAS_BASE_URL = os.getenv("CANVAS_BASE_URL", "https://canvas.instructure.com/api/v1/")
-HEADERS = {
-    "Authorization": f"Bearer {CANVAS_TOKEN}"
-}
+CANVAS_TOKEN = _settings.CANVAS_TOKEN
+CANVAS_BASE_URL = _settings.CANVAS_BASE_URL
+HEADERS = _settings.HEADERS
 
 # Database Configuration (optional, has default in db_manager.py)
-DB_PATH = os.getenv("DB_PATH")
+DB_PATH = _settings.DB_PATH
 
 # Weekly Notification Configuration
-WEEKLY_NOTIFICATION_HOUR = int(os.getenv("WEEKLY_NOTIFICATION_HOUR", "9"))
-WEEKLY_NOTIFICATION_MINUTE = int(os.getenv("WEEKLY_NOTIFICATION_MINUTE", "0"))
+WEEKLY_NOTIFICATION_HOUR = _settings.WEEKLY_NOTIFICATION_HOUR
+WEEKLY_NOTIFICATION_MINUTE = _settings.WEEKLY_NOTIFICATION_MINUTE
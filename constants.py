@@ -1,5 +1,7 @@
 """Application constants."""
 
+import re
+
 # Reminder labels and messages
 WORK_SESSION_REMINDER_LABELS = {
     '24h': '⏰ **24-hour reminder**',
@@ -30,12 +32,22 @@ DAY_NAME_MAP = {
     'sun': 6, 'sunday': 6,
 }
 
+# Day/time input such as 'Wed 7:30 PM'; groups are day, hour, minute, AM/PM
+DAY_TIME_PATTERN = re.compile(r"^\s*([A-Za-z]+)\s+(\d{1,2}):(\d{2})\s*([AaPp][Mm])\s*$")
+
 # Timeouts (in seconds)
 SCHEDULING_TIMEOUT = 120.0
+# Unanswered prompts in a row before !thisweek gives up
+SCHEDULING_MAX_TIMEOUTS = 3
 USER_RESPONSE_TIMEOUT = 90.0
 RESCHEDULE_TIMEOUT = 120.0
 
 # Background task settings
 REMINDER_CHECK_INTERVAL = 1
+DB_MAINTENANCE_INTERVAL_HOURS = 1
 DEFAULT_PER_PAGE = 100
+# Simultaneous connections to Canvas when fetching several courses at once
+CANVAS_MAX_CONNECTIONS = 16
+# Distinct Canvas requests whose last response is kept for ETag revalidation
+CANVAS_ETAG_CACHE_SIZE = 64
 
@@ -8,146 +8,290 @@ Handles all SQLite database operations including:
 """
 
 import aiosqlite
+import functools
 import os
-from datetime import datetime, timedelta, timezone
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable
 from utils.datetime_utils import parse_canvas_datetime, to_utc_iso_z
 from config import DB_PATH
+from database.pool import ConnectionPool
 
 # Fallback if DB_PATH is not set in environment
 if not DB_PATH:
     DB_PATH = "data/canvas_bot.db"
 
+# Bump when adding a migration to _migrate_schema
+SCHEMA_VERSION = 3
+
+
+# ========================================
+# Connection Management
+# ========================================
+
+# Connections come from a pool of one writer and several readers; with WAL
+# enabled, reads never wait behind an in-flight write.
+_pool: ConnectionPool | None = None
+
+# Set once init_db has run against the current pool, so repeat syncs reuse the
+# open connections without re-running schema creation and migration checks
+_schema_ready = False
+
+
+async def _get_pool() -> ConnectionPool:
+    """Return the shared pool, reopening it if DB_PATH was repointed (e.g. by tests)."""
+    global _pool
+    if _pool is not None and _pool.path != DB_PATH:
+        await close_db()
+    if _pool is None:
+        _pool = ConnectionPool(DB_PATH)
+    return _pool
+
+
+@asynccontextmanager
+async def acquire(read: bool = False):
+    """Check out the writer, or a read-only connection when read=True."""
+    pool = await _get_pool()
+    async with pool.acquire(read=read) as db:
+        yield db
+
+
+async def close_db():
+    """Close the shared connections. Call on shutdown or before removing the database file."""
+    global _pool, _schema_ready
+    pool, _pool = _pool, None
+    _schema_ready = False
+    if pool is not None:
+        await pool.close()
+
+
+@asynccontextmanager
+async def _write_transaction():
+    """
+    Run the enclosed writes as one BEGIN IMMEDIATE transaction on the writer.
+    Taking the write lock up front avoids SQLITE_BUSY lock-upgrade races with
+    concurrent readers.
+    """
+    async with acquire() as db:
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        await db.commit()
+
+
+async def run_db_maintenance():
+    """
+    Periodic housekeeping for long-running processes: fold the WAL back into the
+    database file and let SQLite refresh statistics for indexes it has used.
+    """
+    async with acquire() as db:
+        await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        await db.execute("PRAGMA optimize")
+
 
 # ========================================
 # Database Initialization
 # ========================================
 
 async def init_db():
-    """Initialize database schema and perform any necessary migrations."""
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    """
+    Initialize database schema and perform any necessary migrations.
+    Cheap to call repeatedly: after the first call it only checks that the
+    pool still points at DB_PATH.
+    """
+    global _schema_ready
+    await _get_pool()
+    if _schema_ready:
+        return
+
+    # SQLite URIs (e.g. shared-cache in-memory databases) have no directory to create
+    if not DB_PATH.startswith("file:"):
+        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Create courses table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS courses (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                course_code TEXT,
-                start_at TEXT,
-                end_at TEXT
-            )
-        """)
-
-        # Create assignments table with composite PK to avoid cross-course ID collisions
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS assignments (
-                id INTEGER,
-                course_id INTEGER,
-                name TEXT NOT NULL,
-                due_at TEXT,
-                week_number INTEGER,
-                html_url TEXT,
-                submitted INTEGER DEFAULT 0,
-                due_reminder_2d_sent INTEGER DEFAULT 0,
-                due_reminder_1d_sent INTEGER DEFAULT 0,
-                due_reminder_12h_sent INTEGER DEFAULT 0,
-                PRIMARY KEY (course_id, id),
-                FOREIGN KEY (course_id) REFERENCES courses (id)
-            )
-        """)
-        
-        # Migration: Add due date reminder columns if they don't exist
-        for column in ["due_reminder_2d_sent", "due_reminder_1d_sent", "due_reminder_12h_sent"]:
-            try:
-                await db.execute(f"ALTER TABLE assignments ADD COLUMN {column} INTEGER DEFAULT 0")
-            except Exception:
-                pass
+    async with acquire() as db:
+        await _create_schema(db)
+    _schema_ready = True
+
 
-        # Migration: Rebuild assignments table if using old single-column PK schema
+# Weekly listings and due date reminders filter on a due_at range; seek it
+# instead of scanning every synced assignment. Kept separate so the legacy
+# table rebuild in _migrate_schema can recreate it.
+_ASSIGNMENTS_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_assignments_due_at
+    ON assignments(due_at);
+"""
+
+# Every table and index, created if missing. Run as one script so schema setup
+# is a single round trip to the connection's thread rather than one per statement.
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS courses (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        course_code TEXT,
+        start_at TEXT,
+        end_at TEXT
+    );
+
+    -- Composite PK avoids cross-course ID collisions
+    CREATE TABLE IF NOT EXISTS assignments (
+        id INTEGER,
+        course_id INTEGER,
+        name TEXT NOT NULL,
+        due_at TEXT,
+        week_number INTEGER,
+        html_url TEXT,
+        submitted INTEGER DEFAULT 0,
+        due_reminder_2d_sent INTEGER DEFAULT 0,
+        due_reminder_1d_sent INTEGER DEFAULT 0,
+        due_reminder_12h_sent INTEGER DEFAULT 0,
+        PRIMARY KEY (course_id, id),
+        FOREIGN KEY (course_id) REFERENCES courses (id)
+    );
+
+    CREATE TABLE IF NOT EXISTS study_plans (
+        user_id TEXT NOT NULL,
+        course_id INTEGER NOT NULL,
+        assignment_id INTEGER NOT NULL,
+        planned_at_utc TEXT NOT NULL,
+        notes TEXT,
+        reminder_24h_sent INTEGER DEFAULT 0,
+        reminder_1h_sent INTEGER DEFAULT 0,
+        reminder_now_sent INTEGER DEFAULT 0,
+        PRIMARY KEY (user_id, course_id, assignment_id)
+    );
+    -- Weekly plan lookups filter on user and a planned_at range
+    CREATE INDEX IF NOT EXISTS idx_study_plans_user_planned
+    ON study_plans(user_id, planned_at_utc);
+
+    -- User assignment completion tracking
+    CREATE TABLE IF NOT EXISTS user_assignment_status (
+        user_id TEXT NOT NULL,
+        course_id INTEGER NOT NULL,
+        assignment_id INTEGER NOT NULL,
+        completed INTEGER NOT NULL DEFAULT 0,
+        completed_at_utc TEXT,
+        PRIMARY KEY (user_id, course_id, assignment_id)
+    );
+
+    -- Week completion notification tracking
+    CREATE TABLE IF NOT EXISTS week_completion_notifications (
+        user_id TEXT NOT NULL,
+        week_key TEXT NOT NULL,
+        notified INTEGER DEFAULT 0,
+        PRIMARY KEY (user_id, week_key)
+    );
+""" + _ASSIGNMENTS_INDEX_SQL
+
+
+async def _create_schema(db: aiosqlite.Connection):
+    """
+    Create tables and indexes, running pending migrations on older databases.
+    DDL and migrations commit together: one journal sync instead of one per
+    statement, and a failure mid-setup leaves the old schema untouched.
+    """
+    try:
+        # BEGIN goes inside the script because executescript() commits any
+        # transaction that is already open before running
+        await db.executescript("BEGIN IMMEDIATE;" + _SCHEMA_SQL)
+
+        # Migrations only need to run once per database file; the applied
+        # schema version is stored in the SQLite header (PRAGMA user_version).
+        async with db.execute("PRAGMA user_version") as cursor:
+            row = await cursor.fetchone()
+            schema_version = row[0] if row else 0
+
+        # A failed migration leaves the version untouched so it is retried next start
+        if schema_version < SCHEMA_VERSION and await _migrate_schema(db):
+            await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except BaseException:
+        await db.rollback()
+        raise
+    await db.commit()
+
+
+async def _migrate_schema(db: aiosqlite.Connection) -> bool:
+    """Bring databases created by older versions up to the current schema. Returns True on success."""
+    # Migration: Add due date reminder columns if they don't exist
+    for column in ["due_reminder_2d_sent", "due_reminder_1d_sent", "due_reminder_12h_sent"]:
         try:
-            async with db.execute("PRAGMA table_info(assignments)") as cursor:
-                cols = await cursor.fetchall()
-                pk_cols = [c[1] for c in cols if c[5] > 0]  # c[5] is pk flag
-            
-            if pk_cols == ["id"]:
-                await db.execute("BEGIN IMMEDIATE")
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS assignments_new (
-                        id INTEGER,
-                        course_id INTEGER,
-                        name TEXT NOT NULL,
-                        due_at TEXT,
-                        week_number INTEGER,
-                        html_url TEXT,
-                        submitted INTEGER DEFAULT 0,
-                        PRIMARY KEY (course_id, id),
-                        FOREIGN KEY (course_id) REFERENCES courses (id)
-                    )
-                """)
-                await db.execute("""
-                    INSERT OR REPLACE INTO assignments_new
-                        (id, course_id, name, due_at, week_number, html_url, submitted)
-                    SELECT id, course_id, name, due_at, week_number, html_url, submitted
-                    FROM assignments
-                """)
-                await db.execute("DROP TABLE assignments")
-                await db.execute("ALTER TABLE assignments_new RENAME TO assignments")
-                await db.execute("COMMIT")
+            await db.execute(f"ALTER TABLE assignments ADD COLUMN {column} INTEGER DEFAULT 0")
         except Exception:
-            try:
-                await db.execute("ROLLBACK")
-            except Exception:
-                pass
+            pass
 
-        await db.commit()
+    # Migration: Add reminder columns if they don't exist
+    for column in ["reminder_24h_sent", "reminder_1h_sent", "reminder_now_sent"]:
+        try:
+            await db.execute(f"ALTER TABLE study_plans ADD COLUMN {column} INTEGER DEFAULT 0")
+        except Exception:
+            pass
 
-        # Create study plans table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS study_plans (
-                user_id TEXT NOT NULL,
-                course_id INTEGER NOT NULL,
-                assignment_id INTEGER NOT NULL,
-                planned_at_utc TEXT NOT NULL,
-                notes TEXT,
-                reminder_24h_sent INTEGER DEFAULT 0,
-                reminder_1h_sent INTEGER DEFAULT 0,
-                reminder_now_sent INTEGER DEFAULT 0,
-                PRIMARY KEY (user_id, course_id, assignment_id)
-            )
-        """)
-        
-        # Migration: Add reminder columns if they don't exist
-        for column in ["reminder_24h_sent", "reminder_1h_sent", "reminder_now_sent"]:
+    # Migration: The partial index on incomplete statuses was never chosen by
+    # the planner (COALESCE over the LEFT JOIN doesn't imply completed = 0);
+    # the primary key serves those lookups, so stop paying for it on writes
+    await db.execute("DROP INDEX IF EXISTS idx_uas_incomplete")
+
+    # Migration: Rebuild assignments table if using old single-column PK schema
+    async with db.execute("PRAGMA table_info(assignments)") as cursor:
+        cols = await cursor.fetchall()
+        pk_cols = [c[1] for c in cols if c[5] > 0]  # c[5] is pk flag
+
+    if pk_cols == ["id"]:
+        # A savepoint, since init_db already holds the enclosing transaction
+        try:
+            await db.execute("SAVEPOINT rebuild_assignments")
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS assignments_new (
+                    id INTEGER,
+                    course_id INTEGER,
+                    name TEXT NOT NULL,
+                    due_at TEXT,
+                    week_number INTEGER,
+                    html_url TEXT,
+                    submitted INTEGER DEFAULT 0,
+                    due_reminder_2d_sent INTEGER DEFAULT 0,
+                    due_reminder_1d_sent INTEGER DEFAULT 0,
+                    due_reminder_12h_sent INTEGER DEFAULT 0,
+                    PRIMARY KEY (course_id, id),
+                    FOREIGN KEY (course_id) REFERENCES courses (id)
+                )
+            """)
+            await db.execute("""
+                INSERT OR REPLACE INTO assignments_new
+                    (id, course_id, name, due_at, week_number, html_url, submitted,
+                     due_reminder_2d_sent, due_reminder_1d_sent, due_reminder_12h_sent)
+                SELECT id, course_id, name, due_at, week_number, html_url, submitted,
+                       due_reminder_2d_sent, due_reminder_1d_sent, due_reminder_12h_sent
+                FROM assignments
+            """)
+            await db.execute("DROP TABLE assignments")
+            await db.execute("ALTER TABLE assignments_new RENAME TO assignments")
+            # Indexes are dropped along with the old table
+            await db.execute(_ASSIGNMENTS_INDEX_SQL)
+            await db.execute("RELEASE rebuild_assignments")
+        except Exception:
             try:
-                await db.execute(f"ALTER TABLE study_plans ADD COLUMN {column} INTEGER DEFAULT 0")
+                await db.execute("ROLLBACK TO rebuild_assignments")
+                await db.execute("RELEASE rebuild_assignments")
             except Exception:
                 pass
-        
-        await db.commit()
+            return False
 
-        # Create user assignment completion tracking table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS user_assignment_status (
-                user_id TEXT NOT NULL,
-                course_id INTEGER NOT NULL,
-                assignment_id INTEGER NOT NULL,
-                completed INTEGER NOT NULL DEFAULT 0,
-                completed_at_utc TEXT,
-                PRIMARY KEY (user_id, course_id, assignment_id)
-            )
-        """)
-        await db.commit()
+    return True
 
-        # Create week completion notification tracking table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS week_completion_notifications (
-                user_id TEXT NOT NULL,
-                week_key TEXT NOT NULL,
-                notified INTEGER DEFAULT 0,
-                PRIMARY KEY (user_id, week_key)
-            )
-        """)
-        await db.commit()
+
+def _week_range_utc(start_date_local: datetime) -> tuple[str, str]:
+    """
+    UTC ISO bounds for the week starting at start_date_local (Monday 00:00).
+    A naive start_date_local is treated as system local time.
+    """
+    if start_date_local.tzinfo is None:
+        local = datetime.now().astimezone().tzinfo or timezone.utc
+        start_date_local = start_date_local.replace(tzinfo=local)
+    end_date_local = start_date_local + timedelta(days=6, hours=23, minutes=59, seconds=59)
+    return to_utc_iso_z(start_date_local), to_utc_iso_z(end_date_local)
 
 
 # ========================================
@@ -156,22 +300,21 @@ async def init_db():
 
 async def upsert_courses(courses: list[dict]):
     """Insert or update courses from Canvas API."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        for c in courses:
-            await db.execute("""
-                INSERT INTO courses (id, name, course_code, start_at, end_at)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    name=excluded.name,
-                    course_code=excluded.course_code,
-                    start_at=excluded.start_at,
-                    end_at=excluded.end_at
-            """, (c["id"], c["name"], c.get("course_code"), c.get("start_at"), c.get("end_at")))
-        await db.commit()
+    rows = [(c["id"], c["name"], c.get("course_code"), c.get("start_at"), c.get("end_at")) for c in courses]
+    async with _write_transaction() as db:
+        await db.executemany("""
+            INSERT INTO courses (id, name, course_code, start_at, end_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name=excluded.name,
+                course_code=excluded.course_code,
+                start_at=excluded.start_at,
+                end_at=excluded.end_at
+        """, rows)
 
 async def get_courses() -> list[tuple]:
     """Retrieve all courses from the database."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute("SELECT id, name, course_code FROM courses ORDER BY name") as cursor:
             return await cursor.fetchall()
 
@@ -179,54 +322,77 @@ async def get_courses() -> list[tuple]:
 # Assignment Functions
 # -------------------------------------------------------
 
-async def upsert_assignments(assignments: list[dict], course_id: int):
+@functools.lru_cache(maxsize=4096)
+def _iso_week_from_utc_z(value: str) -> int:
+    """ISO week number of a 'YYYY-MM-DDTHH:MM:SSZ' timestamp, read straight from its date fields."""
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10])).isocalendar()[1]
+
+
+def _is_utc_z(value: str) -> bool:
+    """True if value already uses the normalized 'YYYY-MM-DDTHH:MM:SSZ' storage layout."""
+    return len(value) == 20 and value[10] == "T" and value[19] == "Z"
+
+
+_UPSERT_ASSIGNMENT_SQL = """
+    INSERT INTO assignments (id, course_id, name, due_at, week_number, html_url, submitted)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(course_id, id) DO UPDATE SET
+        name=excluded.name,
+        due_at=excluded.due_at,
+        week_number=excluded.week_number,
+        html_url=excluded.html_url,
+        submitted=excluded.submitted
+"""
+
+
+def _assignment_row(a: dict, course_id: int) -> tuple:
+    """Build the parameter tuple for _UPSERT_ASSIGNMENT_SQL from a Canvas assignment."""
+    due_at_raw = a.get("due_at")
+    week_num = None
+    due_at_store = None
+    if due_at_raw and _is_utc_z(due_at_raw):
+        # Canvas' usual format is already what we store; skip the datetime round-trip
+        week_num = _iso_week_from_utc_z(due_at_raw)
+        due_at_store = due_at_raw
+    elif due_at_raw:
+        dt = parse_canvas_datetime(due_at_raw)  # aware
+        week_num = dt.isocalendar().week
+        due_at_store = to_utc_iso_z(dt)
+
+    return (
+        a["id"],
+        course_id,
+        a["name"],
+        due_at_store,
+        week_num,
+        a.get("html_url"),
+        int(a.get("has_submitted_submissions", False))
+    )
+
+
+async def upsert_assignments(assignments: Iterable[dict], course_id: int):
     """Insert or update assignments for a specific course"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        for a in assignments:
-            due_at_raw = a.get("due_at")
-            week_num = None
-            due_at_store = None
-            if due_at_raw:
-                dt = parse_canvas_datetime(due_at_raw)  # aware
-                week_num = dt.isocalendar().week
-                due_at_store = to_utc_iso_z(dt)
+    await upsert_assignments_multi({course_id: assignments})
 
-            await db.execute("""
-                INSERT INTO assignments (id, course_id, name, due_at, week_number, html_url, submitted)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(course_id, id) DO UPDATE SET
-                    name=excluded.name,
-                    due_at=excluded.due_at,
-                    week_number=excluded.week_number,
-                    html_url=excluded.html_url,
-                    submitted=excluded.submitted
-            """, (
-                a["id"],
-                course_id,
-                a["name"],
-                due_at_store,
-                week_num,
-                a.get("html_url"),
-                int(a.get("has_submitted_submissions", False))
-            ))
-        await db.commit()
+
+async def upsert_assignments_multi(by_course: dict[int, Iterable[dict]]):
+    """Insert or update assignments for several courses in a single transaction."""
+    rows = [
+        _assignment_row(a, course_id)
+        for course_id, assignments in by_course.items()
+        for a in assignments
+    ]
+    async with _write_transaction() as db:
+        await db.executemany(_UPSERT_ASSIGNMENT_SQL, rows)
 
 async def get_assignments_for_week(start_date: datetime):
     """
     Get all assignments due during the specified week (Monday - Sunday).
     Returns: List of (name, due_at, course_name, course_code) tuples
     """
-    # Treat provided start_date as local midnight Monday and compute end of week
-    if start_date.tzinfo is None:
-        # Assume local timezone for naive start_date; convert to UTC ranges
-        local = datetime.now().astimezone().tzinfo or timezone.utc
-        start_date = start_date.replace(tzinfo=local)
-    end_date = start_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
+    start_utc_iso, end_utc_iso = _week_range_utc(start_date)
 
-    start_utc_iso = to_utc_iso_z(start_date)
-    end_utc_iso = to_utc_iso_z(end_date)
-
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute(
             """
             SELECT a.name, a.due_at, c.name AS course_name, c.course_code
@@ -245,15 +411,9 @@ async def get_assignments_for_week_with_ids(start_date: datetime):
     Get all assignments due during the specified week with assignment and course IDs.
     Returns: List of (assignment_id, course_id, name, due_at, course_name, course_code) tuples
     """
-    if start_date.tzinfo is None:
-        local = datetime.now().astimezone().tzinfo or timezone.utc
-        start_date = start_date.replace(tzinfo=local)
-    end_date = start_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-    start_utc_iso = to_utc_iso_z(start_date)
-    end_utc_iso = to_utc_iso_z(end_date)
+    start_utc_iso, end_utc_iso = _week_range_utc(start_date)
 
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute(
             """
             SELECT a.id, a.course_id, a.name, a.due_at, c.name AS course_name, c.course_code
@@ -268,7 +428,7 @@ async def get_assignments_for_week_with_ids(start_date: datetime):
 
 async def get_all_assignments() -> list[tuple]:
     """Retrieve all assignments from the database."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute("""
             SELECT a.name, a.due_at, c.name AS course_name
             FROM assignments a
@@ -279,8 +439,16 @@ async def get_all_assignments() -> list[tuple]:
 
 
 async def upsert_study_plan(user_id: str, course_id: int, assignment_id: int, planned_at_iso_utc: str, notes: str | None = None):
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
+    await upsert_study_plans([(user_id, course_id, assignment_id, planned_at_iso_utc, notes)])
+
+
+async def upsert_study_plans(rows: Iterable[tuple]):
+    """
+    Insert or update several study plans in one transaction.
+    Each row is (user_id, course_id, assignment_id, planned_at_iso_utc, notes).
+    """
+    async with _write_transaction() as db:
+        await db.executemany(
             """
             INSERT INTO study_plans (user_id, course_id, assignment_id, planned_at_utc, notes)
             VALUES (?, ?, ?, ?, ?)
@@ -288,22 +456,14 @@ async def upsert_study_plan(user_id: str, course_id: int, assignment_id: int, pl
                 planned_at_utc=excluded.planned_at_utc,
                 notes=excluded.notes
             """,
-            (user_id, course_id, assignment_id, planned_at_iso_utc, notes),
+            rows,
         )
-        await db.commit()
 
 async def get_study_plans_for_week(user_id: str, start_date_local: datetime):
     # Convert provided local range to UTC strings for querying
-    if start_date_local.tzinfo is None:
-        local = datetime.now().astimezone().tzinfo or timezone.utc
-        start_date_local = start_date_local.replace(tzinfo=local)
-    end_date_local = start_date_local + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-    from utils.datetime_utils import to_utc_iso_z
-    start_utc_iso = to_utc_iso_z(start_date_local)
-    end_utc_iso = to_utc_iso_z(end_date_local)
+    start_utc_iso, end_utc_iso = _week_range_utc(start_date_local)
 
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute(
             """
             SELECT user_id, course_id, assignment_id, planned_at_utc, notes
@@ -323,15 +483,9 @@ async def get_user_plans_for_week_detailed(user_id: str, start_date_local: datet
     course details for easier display.
     """
     # Normalize to local tz if naive
-    if start_date_local.tzinfo is None:
-        local = datetime.now().astimezone().tzinfo or timezone.utc
-        start_date_local = start_date_local.replace(tzinfo=local)
-    end_date_local = start_date_local + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-    start_utc_iso = to_utc_iso_z(start_date_local)
-    end_utc_iso = to_utc_iso_z(end_date_local)
+    start_utc_iso, end_utc_iso = _week_range_utc(start_date_local)
 
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute(
             """
             SELECT
@@ -361,7 +515,7 @@ async def get_user_plans_for_week_detailed(user_id: str, start_date_local: datet
 
 async def set_assignment_completed(user_id: str, course_id: int, assignment_id: int, completed: bool, completed_at_iso_utc: str | None = None):
     """Mark an assignment as completed or incomplete for a specific user."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _write_transaction() as db:
         await db.execute(
             """
             INSERT INTO user_assignment_status (user_id, course_id, assignment_id, completed, completed_at_utc)
@@ -372,7 +526,6 @@ async def set_assignment_completed(user_id: str, course_id: int, assignment_id:
             """,
             (user_id, course_id, assignment_id, int(completed), completed_at_iso_utc),
         )
-        await db.commit()
 
 
 async def get_week_assignments_with_status(user_id: str, start_date_local: datetime):
@@ -380,15 +533,9 @@ async def get_week_assignments_with_status(user_id: str, start_date_local: datet
     Get assignments due this week with per-user completion status.
     Returns: List of (assignment_id, course_id, name, due_at, course_code, course_name, completed, submitted) tuples
     """
-    if start_date_local.tzinfo is None:
-        local = datetime.now().astimezone().tzinfo or timezone.utc
-        start_date_local = start_date_local.replace(tzinfo=local)
-    end_date_local = start_date_local + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-    start_utc_iso = to_utc_iso_z(start_date_local)
-    end_utc_iso = to_utc_iso_z(end_date_local)
+    start_utc_iso, end_utc_iso = _week_range_utc(start_date_local)
 
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute(
             """
             SELECT a.id AS assignment_id,
@@ -411,6 +558,39 @@ async def get_week_assignments_with_status(user_id: str, start_date_local: datet
             return await cursor.fetchall()
 
 
+async def get_week_pending_with_status(user_id: str, start_date_local: datetime, include_submitted: bool = False):
+    """
+    Get assignments due this week that the user has not completed, filtered in SQL.
+    Submitted assignments are excluded unless include_submitted is True.
+    Returns: List of (assignment_id, course_id, name, due_at, course_code, course_name, completed, submitted) tuples
+    """
+    start_utc_iso, end_utc_iso = _week_range_utc(start_date_local)
+
+    async with acquire(read=True) as db:
+        async with db.execute(
+            """
+            SELECT a.id AS assignment_id,
+                   a.course_id,
+                   a.name AS assignment_name,
+                   a.due_at AS due_at_utc,
+                   c.course_code,
+                   c.name AS course_name,
+                   COALESCE(uas.completed, 0) AS completed,
+                   COALESCE(a.submitted, 0) AS submitted
+            FROM assignments a
+            JOIN courses c ON c.id = a.course_id
+            LEFT JOIN user_assignment_status uas
+              ON uas.user_id = ? AND uas.course_id = a.course_id AND uas.assignment_id = a.id
+            WHERE a.due_at BETWEEN ? AND ?
+              AND COALESCE(uas.completed, 0) = 0
+              AND (? OR COALESCE(a.submitted, 0) = 0)
+            ORDER BY a.due_at
+            """,
+            (user_id, start_utc_iso, end_utc_iso, int(include_submitted)),
+        ) as cursor:
+            return await cursor.fetchall()
+
+
 # ========================================
 # Work Session Reminder Operations
 # ========================================
@@ -428,7 +608,7 @@ async def get_pending_reminders(now_utc: datetime):
     
     results = []
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         # Check for 24-hour reminders (planned time is 24 hours from now, +/- 1 minute)
         h24_start = to_utc_iso_z(now_utc + timedelta(hours=24, minutes=-1))
         h24_end = to_utc_iso_z(now_utc + timedelta(hours=24, minutes=1))
@@ -486,35 +666,38 @@ async def get_pending_reminders(now_utc: datetime):
             for row in rows:
                 results.append(row + ('now',))
     
-    return results
+        return results
 
 
-async def mark_reminder_sent(user_id: str, course_id: int, assignment_id: int, reminder_type: str):
-    """Mark a specific reminder as sent for a study plan."""
-    column_map = {
+# Full statement text per reminder type, built once so every call hands
+# sqlite3 an identical string and hits its prepared-statement cache
+_MARK_REMINDER_SQL = {
+    reminder_type: f"""
+        UPDATE study_plans
+        SET {column} = 1
+        WHERE user_id = ? AND course_id = ? AND assignment_id = ?
+    """
+    for reminder_type, column in {
         '24h': 'reminder_24h_sent',
         '1h': 'reminder_1h_sent',
         'now': 'reminder_now_sent'
-    }
-    column = column_map.get(reminder_type)
-    if not column:
+    }.items()
+}
+
+
+async def mark_reminder_sent(user_id: str, course_id: int, assignment_id: int, reminder_type: str):
+    """Mark a specific reminder as sent for a study plan."""
+    sql = _MARK_REMINDER_SQL.get(reminder_type)
+    if not sql:
         return
     
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            f"""
-            UPDATE study_plans
-            SET {column} = 1
-            WHERE user_id = ? AND course_id = ? AND assignment_id = ?
-            """,
-            (user_id, course_id, assignment_id),
-        )
-        await db.commit()
+    async with _write_transaction() as db:
+        await db.execute(sql, (user_id, course_id, assignment_id))
 
 
 async def update_study_plan_time(user_id: str, course_id: int, assignment_id: int, new_planned_at_utc: str):
     """Update the planned time for a study session and reset all reminder flags."""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _write_transaction() as db:
         await db.execute(
             """
             UPDATE study_plans
@@ -526,7 +709,6 @@ async def update_study_plan_time(user_id: str, course_id: int, assignment_id: in
             """,
             (new_planned_at_utc, user_id, course_id, assignment_id),
         )
-        await db.commit()
 
 
 # ========================================
@@ -552,7 +734,7 @@ async def get_pending_due_date_reminders(now_utc: datetime, user_id: str):
     
     results = []
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         # Check for 2-day reminders (due date is 2 days from now, +/- 1 minute)
         d2_start = to_utc_iso_z(now_utc + timedelta(days=2, minutes=-1))
         d2_end = to_utc_iso_z(now_utc + timedelta(days=2, minutes=1))
@@ -616,89 +798,75 @@ async def get_pending_due_date_reminders(now_utc: datetime, user_id: str):
             for row in rows:
                 results.append(row + ('12h',))
     
-    return results
+        return results
 
 
-async def mark_due_date_reminder_sent(course_id: int, assignment_id: int, reminder_type: str):
-    """Mark a specific due date reminder as sent for an assignment."""
-    column_map = {
+_MARK_DUE_DATE_REMINDER_SQL = {
+    reminder_type: f"""
+        UPDATE assignments
+        SET {column} = 1
+        WHERE course_id = ? AND id = ?
+    """
+    for reminder_type, column in {
         '2d': 'due_reminder_2d_sent',
         '1d': 'due_reminder_1d_sent',
         '12h': 'due_reminder_12h_sent'
-    }
-    column = column_map.get(reminder_type)
-    if not column:
+    }.items()
+}
+
+
+async def mark_due_date_reminder_sent(course_id: int, assignment_id: int, reminder_type: str):
+    """Mark a specific due date reminder as sent for an assignment."""
+    sql = _MARK_DUE_DATE_REMINDER_SQL.get(reminder_type)
+    if not sql:
         return
     
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            f"""
-            UPDATE assignments
-            SET {column} = 1
-            WHERE course_id = ? AND id = ?
-            """,
-            (course_id, assignment_id),
-        )
-        await db.commit()
+    async with _write_transaction() as db:
+        await db.execute(sql, (course_id, assignment_id))
 
 
 # ========================================
 # Week Completion Tracking
 # ========================================
 
-async def check_week_completion(user_id: str, start_date_local: datetime):
+async def get_week_completion_counts(user_id: str, start_date_local: datetime):
     """
-    Check if all assignments for the current week are completed.
-    Returns: (all_complete: bool, total_count: int, completed_count: int)
+    Count this week's assignments and how many the user has completed.
+    Returns: (total_count: int, completed_count: int)
     """
-    if start_date_local.tzinfo is None:
-        local = datetime.now().astimezone().tzinfo or timezone.utc
-        start_date_local = start_date_local.replace(tzinfo=local)
-    end_date_local = start_date_local + timedelta(days=6, hours=23, minutes=59, seconds=59)
+    start_utc_iso, end_utc_iso = _week_range_utc(start_date_local)
 
-    start_utc_iso = to_utc_iso_z(start_date_local)
-    end_utc_iso = to_utc_iso_z(end_date_local)
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Get total assignments for the week
-        async with db.execute(
-            """
-            SELECT COUNT(*)
-            FROM assignments a
-            WHERE a.due_at BETWEEN ? AND ?
-            """,
-            (start_utc_iso, end_utc_iso),
-        ) as cursor:
-            row = await cursor.fetchone()
-            total_count = row[0] if row else 0
-        
-        if total_count == 0:
-            return (True, 0, 0)  # No assignments = all complete
-        
-        # Get completed assignments for this user
+    async with acquire(read=True) as db:
         async with db.execute(
             """
-            SELECT COUNT(*)
+            SELECT COUNT(*), COALESCE(SUM(uas.completed = 1), 0)
             FROM assignments a
-            JOIN user_assignment_status uas
+            LEFT JOIN user_assignment_status uas
               ON uas.user_id = ? AND uas.course_id = a.course_id AND uas.assignment_id = a.id
             WHERE a.due_at BETWEEN ? AND ?
-              AND uas.completed = 1
             """,
             (user_id, start_utc_iso, end_utc_iso),
         ) as cursor:
-            row = await cursor.fetchone()
-            completed_count = row[0] if row else 0
-        
-        all_complete = (completed_count == total_count)
-        return (all_complete, total_count, completed_count)
+            total_count, completed_count = await cursor.fetchone()
+            return (total_count, completed_count)
+
+
+async def check_week_completion(user_id: str, start_date_local: datetime):
+    """
+    Check if all assignments for the current week are completed.
+    Returns: (all_complete: bool, total_count: int, completed_count: int)
+    """
+    total_count, completed_count = await get_week_completion_counts(user_id, start_date_local)
+    # No assignments counts as all complete
+    all_complete = (completed_count == total_count)
+    return (all_complete, total_count, completed_count)
 
 
 async def get_week_completion_notified(user_id: str, week_start: datetime):
     """Check if completion notification was already sent for this week."""
     week_key = week_start.strftime("%Y-%U")  # Year-Week format
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with acquire(read=True) as db:
         async with db.execute(
             """
             SELECT notified
@@ -715,7 +883,7 @@ async def mark_week_completion_notified(user_id: str, week_start: datetime):
     """Mark that completion notification was sent for this week."""
     week_key = week_start.strftime("%Y-%U")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _write_transaction() as db:
         await db.execute(
             """
             INSERT INTO week_completion_notifications (user_id, week_key, notified)
@@ -724,4 +892,3 @@ async def mark_week_completion_notified(user_id: str, week_start: datetime):
             """,
             (user_id, week_key),
         )
-        await db.commit()
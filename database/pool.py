@@ -0,0 +1,109 @@
+"""
+SQLite connection pool for the database layer.
+WAL mode allows many concurrent readers alongside a single writer, so the
+pool keeps one read-write connection (serialized behind a lock) and a small
+queue of read-only connections that SELECTs check out and return.
+"""
+
+import aiosqlite
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# Each aiosqlite connection runs on its own thread and mostly waits on I/O, so
+# keep at least two readers even on one core, and cap the count so idle
+# threads and page caches stay bounded for a single bot process.
+DEFAULT_READERS = max(2, min(4, os.cpu_count() or 1))
+
+# Applied to every connection: fsync only at checkpoints (safe under WAL),
+# in-memory temp tables, a ~20 MB page cache, reads served from a memory map
+# of up to 256 MB instead of a read() syscall per page, and waiting up to 5 s
+# on a locked database instead of failing with SQLITE_BUSY.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+"""
+
+
+class ConnectionPool:
+    """One writer plus N read-only connections to a single SQLite database file."""
+
+    def __init__(self, path: str, readers: int = DEFAULT_READERS):
+        self.path = path
+        self._reader_count = max(1, readers)
+        self._writer: aiosqlite.Connection | None = None
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._all_readers: list[aiosqlite.Connection] = []
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+
+    async def open(self):
+        """Open the writer and all readers. Safe to call more than once."""
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+
+            # The writer goes first so WAL is enabled before any reader attaches
+            is_uri = self.path.startswith("file:")
+            writer = await aiosqlite.connect(self.path, uri=is_uri)
+            # Checkpoint automatically every 1000 pages so the WAL file stays small
+            await writer.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA wal_autocheckpoint=1000;
+            """ + _CONNECTION_PRAGMAS)
+
+            # A caller-supplied URI (e.g. a shared-cache in-memory database) may
+            # already carry a mode, so its readers are made read-only by PRAGMA.
+            if is_uri:
+                read_uri, read_pragmas = self.path, "PRAGMA query_only=ON; PRAGMA read_uncommitted=ON;"
+            else:
+                read_uri, read_pragmas = Path(self.path).resolve().as_uri() + "?mode=ro", "PRAGMA read_uncommitted=ON;"
+            try:
+                for _ in range(self._reader_count):
+                    reader = await aiosqlite.connect(read_uri, uri=True)
+                    self._all_readers.append(reader)
+                    await reader.executescript(_CONNECTION_PRAGMAS + read_pragmas)
+                    self._readers.put_nowait(reader)
+            except BaseException:
+                await self._close_connections(writer)
+                raise
+            self._writer = writer
+
+    async def close(self):
+        """Close every connection. Call on shutdown or before removing the database file."""
+        async with self._open_lock:
+            writer, self._writer = self._writer, None
+            await self._close_connections(writer)
+
+    async def _close_connections(self, writer: aiosqlite.Connection | None):
+        readers, self._all_readers = self._all_readers, []
+        self._readers = asyncio.Queue()
+        for reader in readers:
+            await reader.close()
+        if writer is not None:
+            await writer.close()
+
+    @asynccontextmanager
+    async def acquire(self, read: bool = False):
+        """
+        Check out a connection for the duration of the block. Readers are
+        shared round-robin through a queue; the writer is held exclusively.
+        """
+        if self._writer is None:
+            await self.open()
+
+        if not read:
+            async with self._write_lock:
+                yield self._writer
+            return
+
+        readers = self._readers
+        db = await readers.get()
+        try:
+            yield db
+        finally:
+            readers.put_nowait(db)
@@ -1,4 +1,4 @@
-from canvas_api.endpoints import get_courses, get_assignments
+from canvas_api.endpoints import get_courses, iter_assignments
 
 def main():
     courses = get_courses()
@@ -7,8 +7,7 @@ def main():
             course_id = course["id"]
             course_name = course.get("name", "")
             f.write(f"=== Course {course_id}: {course_name} ===\n")
-            assignments = get_assignments(course_id)
-            for a in assignments:
+            for a in iter_assignments(course_id):
                 name = a.get("name")
                 due_at = a.get("due_at")
                 f.write(f"  - {name} | due_at: {due_at}\n")
@@ -1,53 +1,45 @@
 """Canvas service layer for formatting Canvas data."""
 
-from typing import List
-from canvas_api.endpoints import get_courses, get_assignments
+from typing import Any, Dict, Iterator, List
+from canvas_api.endpoints import get_courses, iter_assignments
 from utils.datetime_utils import format_local
 
 
 def get_formatted_courses() -> List[str]:
     """Fetch courses from Canvas and return formatted display strings."""
-    courses = get_courses()
-    formatted: List[str] = []
-    
-    for course in courses:
-        course_id = course.get("id", "N/A")
-        name = course.get("name", "Unnamed Course")
-        code = course.get("course_code", "")
-        
-        if code:
-            formatted.append(f"{course_id} – {code}: {name}")
-        else:
-            formatted.append(f"{course_id} – {name}")
-    
-    return formatted
-
-
-def get_formatted_assignments(course_id: int) -> List[str]:
-    """Fetch assignments for a course and return formatted display strings."""
-    assignments = get_assignments(course_id)
-    
-    if not assignments:
-        return ["No assignments found."]
-
-    formatted: List[str] = []
-    
-    for assignment in assignments:
-        name = assignment.get("name", "Untitled Assignment")
-        due_at = assignment.get("due_at")
-        points = assignment.get("points_possible", 0)
-        url = assignment.get("html_url", "")
-
-        # Format due date using datetime utility
-        if due_at:
-            try:
-                due_str = format_local(due_at)
-            except Exception:
-                due_str = due_at
-        else:
-            due_str = "No due date"
-
-        formatted.append(f"📚 [{name}]({url}) – due {due_str} – {points} pts")
-
-    return formatted
-
+    return [_format_course(course) for course in get_courses()]
+
+
+def _format_course(course: Dict[str, Any]) -> str:
+    """Format one course as 'id – code: name', or 'id – name' when it has no code."""
+    # get_courses() always emits these keys, so index directly instead of .get() fallbacks
+    code = course["course_code"]
+    return f"{course['id']} – {code}: {course['name']}" if code else f"{course['id']} – {course['name']}"
+
+
+def get_formatted_assignments(course_id: int) -> Iterator[str]:
+    """
+    Fetch assignments for a course and yield formatted display strings one at a
+    time, so callers paging output into Discord messages can send as they go.
+    """
+    found = False
+    # Streamed from Canvas a page at a time rather than fetched in full first
+    for a in iter_assignments(course_id):
+        found = True
+        yield (
+            f"📚 [{a.get('name', 'Untitled Assignment')}]({a.get('html_url', '')})"
+            f" – due {_format_due(a.get('due_at'))} – {a.get('points_possible', 0)} pts"
+        )
+
+    if not found:
+        yield "No assignments found."
+
+
+def _format_due(due_at: str | None) -> str:
+    """Format a due date for display, falling back to the raw value if it can't be parsed."""
+    if not due_at:
+        return "No due date"
+    try:
+        return format_local(due_at)
+    except Exception:
+        return due_at
@@ -3,19 +3,44 @@ Acceptance tests for core user workflows.
 Tests end-to-end scenarios from a user's perspective.
 """
 
+import asyncio
 import unittest
-import os
 from datetime import datetime, timezone, timedelta
 import database.db_manager as db_manager
 from database.db_manager import (
-    init_db, upsert_courses, upsert_assignments,
-    upsert_study_plan, get_user_plans_for_week_detailed,
-    set_assignment_completed, get_week_assignments_with_status
+    init_db, upsert_courses, upsert_assignments, upsert_assignments_multi,
+    upsert_study_plan, upsert_study_plans, get_user_plans_for_week_detailed,
+    set_assignment_completed, get_week_assignments_with_status,
+    get_week_pending_with_status, get_week_completion_counts
 )
 from utils.datetime_utils import to_utc_iso_z
 
 
-class TestStudentWeeklyPlanningWorkflow(unittest.IsolatedAsyncioTestCase):
+def _current_monday_utc() -> datetime:
+    """Midnight UTC on the Monday of the current week."""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=today.weekday())
+
+
+def _week_iso(monday: datetime, days: int, hours: int = 0, minutes: int = 0) -> str:
+    """Stored 'Z' timestamp for a point in the week, as an offset from Monday."""
+    return to_utc_iso_z(monday + timedelta(days=days, hours=hours, minutes=minutes))
+
+
+class EagerTaskTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Runs tasks eagerly where supported (Python 3.12+): workflow steps against a
+    shared-cache in-memory SQLite database usually finish without suspending,
+    so they skip a trip through the event loop scheduler.
+    """
+
+    async def asyncSetUp(self):
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+
+class TestStudentWeeklyPlanningWorkflow(EagerTaskTestCase):
     """
     User Story: As a student, I want to plan my weekly study sessions
     so that I can stay organized and complete assignments on time.
@@ -29,20 +54,19 @@ class TestStudentWeeklyPlanningWorkflow(unittest.IsolatedAsyncioTestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.test_db_path = "data/test_acceptance_workflow.db"
+        cls.test_db_path = f"file:acceptance_{cls.__name__}?mode=memory&cache=shared"
+        cls.monday = _current_monday_utc()
 
     async def asyncSetUp(self):
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        
+        await super().asyncSetUp()
         self.original_db_path = db_manager.DB_PATH
         db_manager.DB_PATH = self.test_db_path
         await init_db()
 
     async def asyncTearDown(self):
+        # Closing the last connection drops the in-memory database
+        await db_manager.close_db()
         db_manager.DB_PATH = self.original_db_path
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
 
     async def test_student_plans_weekly_study_sessions(self):
         """
@@ -61,26 +85,25 @@ class TestStudentWeeklyPlanningWorkflow(unittest.IsolatedAsyncioTestCase):
             "course_code": "CS101"
         }])
         
-        monday = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        monday = monday - timedelta(days=monday.weekday())
+        monday = self.monday
         
         await upsert_assignments([
             {
                 "id": 1001,
                 "name": "Homework 1 - Variables",
-                "due_at": to_utc_iso_z(monday + timedelta(days=3, hours=23, minutes=59)),
+                "due_at": _week_iso(monday, days=3, hours=23, minutes=59),
                 "has_submitted_submissions": False
             },
             {
                 "id": 1002,
                 "name": "Quiz 1 - Control Flow",
-                "due_at": to_utc_iso_z(monday + timedelta(days=4, hours=23, minutes=59)),
+                "due_at": _week_iso(monday, days=4, hours=23, minutes=59),
                 "has_submitted_submissions": False
             },
             {
                 "id": 1003,
                 "name": "Lab 1 - Functions",
-                "due_at": to_utc_iso_z(monday + timedelta(days=5, hours=23, minutes=59)),
+                "due_at": _week_iso(monday, days=5, hours=23, minutes=59),
                 "has_submitted_submissions": False
             }
         ], 101)
@@ -90,7 +113,7 @@ class TestStudentWeeklyPlanningWorkflow(unittest.IsolatedAsyncioTestCase):
             user_id="sarah_student",
             course_id=101,
             assignment_id=1001,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=1, hours=14)),  # Tuesday 2 PM
+            planned_at_iso_utc=_week_iso(monday, days=1, hours=14),  # Tuesday 2 PM
             notes="Review chapter 2 on variables and data types"
         )
         
@@ -98,7 +121,7 @@ class TestStudentWeeklyPlanningWorkflow(unittest.IsolatedAsyncioTestCase):
             user_id="sarah_student",
             course_id=101,
             assignment_id=1002,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=2, hours=15)),  # Wednesday 3 PM
+            planned_at_iso_utc=_week_iso(monday, days=2, hours=15),  # Wednesday 3 PM
             notes="Practice if/else and loops from slides"
         )
         
@@ -106,7 +129,7 @@ class TestStudentWeeklyPlanningWorkflow(unittest.IsolatedAsyncioTestCase):
             user_id="sarah_student",
             course_id=101,
             assignment_id=1003,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=4, hours=10)),  # Friday 10 AM
+            planned_at_iso_utc=_week_iso(monday, days=4, hours=10),  # Friday 10 AM
             notes="Complete lab exercises on functions"
         )
         
@@ -127,7 +150,7 @@ class TestStudentWeeklyPlanningWorkflow(unittest.IsolatedAsyncioTestCase):
         self.assertIn("Review chapter 2 on variables and data types", str(notes_list))
 
 
-class TestAssignmentCompletionWorkflow(unittest.IsolatedAsyncioTestCase):
+class TestAssignmentCompletionWorkflow(EagerTaskTestCase):
     """
     User Story: As a student, I want to track my assignment completion
     so that I know what I've finished and what remains.
@@ -141,20 +164,19 @@ class TestAssignmentCompletionWorkflow(unittest.IsolatedAsyncioTestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.test_db_path = "data/test_acceptance_completion.db"
+        cls.test_db_path = f"file:acceptance_{cls.__name__}?mode=memory&cache=shared"
+        cls.monday = _current_monday_utc()
 
     async def asyncSetUp(self):
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        
+        await super().asyncSetUp()
         self.original_db_path = db_manager.DB_PATH
         db_manager.DB_PATH = self.test_db_path
         await init_db()
 
     async def asyncTearDown(self):
+        # Closing the last connection drops the in-memory database
+        await db_manager.close_db()
         db_manager.DB_PATH = self.original_db_path
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
 
     async def test_student_tracks_assignment_completion(self):
         """
@@ -173,30 +195,24 @@ class TestAssignmentCompletionWorkflow(unittest.IsolatedAsyncioTestCase):
             "course_code": "CS201"
         }])
         
-        monday = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        monday = monday - timedelta(days=monday.weekday())
+        monday = self.monday
         
         assignments = [
-            {"id": 2001, "name": "Assignment 1", "due_at": to_utc_iso_z(monday + timedelta(days=2)), "has_submitted_submissions": False},
-            {"id": 2002, "name": "Assignment 2", "due_at": to_utc_iso_z(monday + timedelta(days=3)), "has_submitted_submissions": False},
-            {"id": 2003, "name": "Assignment 3", "due_at": to_utc_iso_z(monday + timedelta(days=4)), "has_submitted_submissions": False},
-            {"id": 2004, "name": "Assignment 4", "due_at": to_utc_iso_z(monday + timedelta(days=5)), "has_submitted_submissions": False}
+            {"id": 2001, "name": "Assignment 1", "due_at": _week_iso(monday, days=2), "has_submitted_submissions": False},
+            {"id": 2002, "name": "Assignment 2", "due_at": _week_iso(monday, days=3), "has_submitted_submissions": False},
+            {"id": 2003, "name": "Assignment 3", "due_at": _week_iso(monday, days=4), "has_submitted_submissions": False},
+            {"id": 2004, "name": "Assignment 4", "due_at": _week_iso(monday, days=5), "has_submitted_submissions": False}
         ]
         await upsert_assignments(assignments, 201)
         
         # Michael creates study plans for all
-        for i, assign in enumerate(assignments):
-            await upsert_study_plan(
-                user_id="michael_student",
-                course_id=201,
-                assignment_id=assign["id"],
-                planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=i)),
-                notes=f"Work on {assign['name']}"
-            )
+        await upsert_study_plans([
+            ("michael_student", 201, assign["id"], _week_iso(monday, days=i), f"Work on {assign['name']}")
+            for i, assign in enumerate(assignments)
+        ])
         
         # Initially, nothing is complete
-        week_status = await get_week_assignments_with_status("michael_student", monday)
-        completed_count = sum(1 for row in week_status if row[6] == 1)
+        total_count, completed_count = await get_week_completion_counts("michael_student", monday)
         self.assertEqual(completed_count, 0, "Initially no assignments should be complete")
         
         # Michael completes first two assignments
@@ -204,16 +220,45 @@ class TestAssignmentCompletionWorkflow(unittest.IsolatedAsyncioTestCase):
         await set_assignment_completed("michael_student", 201, 2002, True)
         
         # Check progress
-        week_status = await get_week_assignments_with_status("michael_student", monday)
-        completed_count = sum(1 for row in week_status if row[6] == 1)
-        incomplete_count = sum(1 for row in week_status if row[6] == 0)
+        total_count, completed_count = await get_week_completion_counts("michael_student", monday)
         
         self.assertEqual(completed_count, 2, "Should have 2 completed assignments")
-        self.assertEqual(incomplete_count, 2, "Should have 2 incomplete assignments")
-        self.assertEqual(len(week_status), 4, "Should have 4 total assignments")
+        self.assertEqual(total_count - completed_count, 2, "Should have 2 incomplete assignments")
+        self.assertEqual(total_count, 4, "Should have 4 total assignments")
 
+    async def test_student_sees_only_pending_assignments(self):
+        """
+        SCENARIO: Student lists what is still left to do this week
 
-class TestMultiCourseManagement(unittest.IsolatedAsyncioTestCase):
+        GIVEN Michael has 3 assignments, one completed and one already submitted
+        WHEN he asks for his pending work
+        THEN completed assignments should never be listed
+        AND submitted assignments should only be listed when requested
+        """
+        await upsert_courses([{
+            "id": 201,
+            "name": "Data Structures",
+            "course_code": "CS201"
+        }])
+
+        monday = self.monday
+
+        await upsert_assignments([
+            {"id": 2001, "name": "Assignment 1", "due_at": _week_iso(monday, days=2), "has_submitted_submissions": False},
+            {"id": 2002, "name": "Assignment 2", "due_at": _week_iso(monday, days=3), "has_submitted_submissions": True},
+            {"id": 2003, "name": "Assignment 3", "due_at": _week_iso(monday, days=4), "has_submitted_submissions": False}
+        ], 201)
+        await set_assignment_completed("michael_student", 201, 2001, True)
+
+        pending = await get_week_pending_with_status("michael_student", monday)
+        self.assertEqual([row[0] for row in pending], [2003])
+
+        pending = await get_week_pending_with_status("michael_student", monday, include_submitted=True)
+        self.assertEqual([row[0] for row in pending], [2002, 2003])
+        self.assertEqual(pending[0][7], 1, "Submitted flag should be carried through")
+
+
+class TestMultiCourseManagement(EagerTaskTestCase):
     """
     User Story: As a student taking multiple courses, I want to manage
     assignments across all my classes in one place.
@@ -227,20 +272,19 @@ class TestMultiCourseManagement(unittest.IsolatedAsyncioTestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.test_db_path = "data/test_acceptance_multi_course.db"
+        cls.test_db_path = f"file:acceptance_{cls.__name__}?mode=memory&cache=shared"
+        cls.monday = _current_monday_utc()
 
     async def asyncSetUp(self):
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        
+        await super().asyncSetUp()
         self.original_db_path = db_manager.DB_PATH
         db_manager.DB_PATH = self.test_db_path
         await init_db()
 
     async def asyncTearDown(self):
+        # Closing the last connection drops the in-memory database
+        await db_manager.close_db()
         db_manager.DB_PATH = self.original_db_path
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
 
     async def test_student_manages_multiple_courses(self):
         """
@@ -259,30 +303,21 @@ class TestMultiCourseManagement(unittest.IsolatedAsyncioTestCase):
             {"id": 303, "name": "Physics I", "course_code": "PHYS101"}
         ])
         
-        monday = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        monday = monday - timedelta(days=monday.weekday())
-        
-        # CS assignment
-        await upsert_assignments([
-            {"id": 3001, "name": "Programming Project", "due_at": to_utc_iso_z(monday + timedelta(days=3)), "has_submitted_submissions": False}
-        ], 301)
-        
-        # Math assignment
-        await upsert_assignments([
-            {"id": 3002, "name": "Problem Set 5", "due_at": to_utc_iso_z(monday + timedelta(days=4)), "has_submitted_submissions": False}
-        ], 302)
+        monday = self.monday
         
-        # Physics assignment
-        await upsert_assignments([
-            {"id": 3003, "name": "Lab Report", "due_at": to_utc_iso_z(monday + timedelta(days=5)), "has_submitted_submissions": False}
-        ], 303)
+        # One assignment per course, stored in a single transaction
+        await upsert_assignments_multi({
+            301: [{"id": 3001, "name": "Programming Project", "due_at": _week_iso(monday, days=3), "has_submitted_submissions": False}],
+            302: [{"id": 3002, "name": "Problem Set 5", "due_at": _week_iso(monday, days=4), "has_submitted_submissions": False}],
+            303: [{"id": 3003, "name": "Lab Report", "due_at": _week_iso(monday, days=5), "has_submitted_submissions": False}],
+        })
         
         # Emma plans sessions for all three courses
         await upsert_study_plan(
             user_id="emma_student",
             course_id=301,
             assignment_id=3001,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=1, hours=14)),
+            planned_at_iso_utc=_week_iso(monday, days=1, hours=14),
             notes="Code the main algorithm"
         )
         
@@ -290,7 +325,7 @@ class TestMultiCourseManagement(unittest.IsolatedAsyncioTestCase):
             user_id="emma_student",
             course_id=302,
             assignment_id=3002,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=2, hours=16)),
+            planned_at_iso_utc=_week_iso(monday, days=2, hours=16),
             notes="Practice derivatives"
         )
         
@@ -298,7 +333,7 @@ class TestMultiCourseManagement(unittest.IsolatedAsyncioTestCase):
             user_id="emma_student",
             course_id=303,
             assignment_id=3003,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=3, hours=10)),
+            planned_at_iso_utc=_week_iso(monday, days=3, hours=10),
             notes="Write analysis section"
         )
         
@@ -324,7 +359,7 @@ class TestMultiCourseManagement(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(completed_assignments[0][0], 3001)  # CS assignment ID
 
 
-class TestUserIsolation(unittest.IsolatedAsyncioTestCase):
+class TestUserIsolation(EagerTaskTestCase):
     """
     User Story: As a student, my data should be separate from other students
     so that my plans and completion status are private.
@@ -337,20 +372,19 @@ class TestUserIsolation(unittest.IsolatedAsyncioTestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.test_db_path = "data/test_acceptance_isolation.db"
+        cls.test_db_path = f"file:acceptance_{cls.__name__}?mode=memory&cache=shared"
+        cls.monday = _current_monday_utc()
 
     async def asyncSetUp(self):
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        
+        await super().asyncSetUp()
         self.original_db_path = db_manager.DB_PATH
         db_manager.DB_PATH = self.test_db_path
         await init_db()
 
     async def asyncTearDown(self):
+        # Closing the last connection drops the in-memory database
+        await db_manager.close_db()
         db_manager.DB_PATH = self.original_db_path
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
 
     async def test_multiple_students_data_isolation(self):
         """
@@ -368,11 +402,10 @@ class TestUserIsolation(unittest.IsolatedAsyncioTestCase):
             "course_code": "CS101"
         }])
         
-        monday = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        monday = monday - timedelta(days=monday.weekday())
+        monday = self.monday
         
         await upsert_assignments([
-            {"id": 4001, "name": "Shared Assignment", "due_at": to_utc_iso_z(monday + timedelta(days=5)), "has_submitted_submissions": False}
+            {"id": 4001, "name": "Shared Assignment", "due_at": _week_iso(monday, days=5), "has_submitted_submissions": False}
         ], 401)
         
         # Alex plans to work on Wednesday
@@ -380,7 +413,7 @@ class TestUserIsolation(unittest.IsolatedAsyncioTestCase):
             user_id="alex",
             course_id=401,
             assignment_id=4001,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=2, hours=10)),
+            planned_at_iso_utc=_week_iso(monday, days=2, hours=10),
             notes="Alex's plan: Start early"
         )
         
@@ -389,7 +422,7 @@ class TestUserIsolation(unittest.IsolatedAsyncioTestCase):
             user_id="jordan",
             course_id=401,
             assignment_id=4001,
-            planned_at_iso_utc=to_utc_iso_z(monday + timedelta(days=4, hours=18)),
+            planned_at_iso_utc=_week_iso(monday, days=4, hours=18),
             notes="Jordan's plan: Finish before deadline"
         )
         
@@ -3,12 +3,23 @@ Integration tests for Canvas API client and endpoints.
 Tests the complete flow of fetching and processing Canvas data.
 """
 
+import json
 import unittest
 from unittest.mock import Mock, patch
 from canvas_api.client import CanvasClient
 from canvas_api.endpoints import get_courses, get_assignments
 
 
+def _json_response(payload, link: str = "") -> Mock:
+    """Build a stand-in for requests.Response carrying a JSON body and Link header."""
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    response.headers = {"Link": link} if link else {}
+    return response
+
+
 class TestCanvasIntegration(unittest.TestCase):
     """Integration tests for Canvas API components."""
 
@@ -19,12 +30,10 @@ class TestCanvasIntegration(unittest.TestCase):
             token="test_token"
         )
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
     def test_fetch_courses_and_assignments_flow(self, mock_get):
         """Test complete flow: fetch courses, then fetch assignments for each."""
-        # Mock courses response
-        courses_response = Mock()
-        courses_response.json.return_value = [
+        courses_response = _json_response([
             {
                 "id": 101,
                 "name": "Introduction to Python",
@@ -35,12 +44,10 @@ class TestCanvasIntegration(unittest.TestCase):
                 "name": "Data Structures",
                 "course_code": "CS201"
             }
-        ]
-        courses_response.headers.get.return_value = ""
+        ])
 
-        # Mock assignments response for course 101
-        assignments_response = Mock()
-        assignments_response.json.return_value = [
+        # Assignments response for course 101
+        assignments_response = _json_response([
             {
                 "id": 1001,
                 "name": "Homework 1",
@@ -48,8 +55,7 @@ class TestCanvasIntegration(unittest.TestCase):
                 "html_url": "https://canvas.com/courses/101/assignments/1001",
                 "has_submitted_submissions": False
             }
-        ]
-        assignments_response.headers.get.return_value = ""
+        ])
 
         mock_get.side_effect = [courses_response, assignments_response]
 
@@ -100,24 +106,16 @@ class TestCanvasIntegration(unittest.TestCase):
         self.assertEqual(assignments[0]["id"], 1)
         self.assertEqual(assignments[1]["has_submitted_submissions"], True)
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
     def test_pagination_with_real_data_structure(self, mock_get):
         """Test pagination handling with realistic multi-page data."""
-        # Page 1
-        page1_response = Mock()
-        page1_response.json.return_value = [
-            {"id": i, "name": f"Course {i}", "course_code": f"C{i}"}
-            for i in range(1, 101)
-        ]
-        page1_response.headers.get.return_value = '<https://test.canvas.com/courses?page=2>; rel="next"'
-
-        # Page 2
-        page2_response = Mock()
-        page2_response.json.return_value = [
-            {"id": i, "name": f"Course {i}", "course_code": f"C{i}"}
-            for i in range(101, 151)
-        ]
-        page2_response.headers.get.return_value = ""
+        page1_response = _json_response(
+            [{"id": i, "name": f"Course {i}", "course_code": f"C{i}"} for i in range(1, 101)],
+            link='<https://test.canvas.com/courses?page=2>; rel="next"',
+        )
+        page2_response = _json_response(
+            [{"id": i, "name": f"Course {i}", "course_code": f"C{i}"} for i in range(101, 151)]
+        )
 
         mock_get.side_effect = [page1_response, page2_response]
 
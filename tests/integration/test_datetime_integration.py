@@ -172,12 +172,15 @@ class TestDatetimeIntegration(unittest.TestCase):
 
     def test_week_boundary_edge_cases(self):
         """Test week calculations at week boundaries."""
+        # Week boundaries are local, so build the references in local time
+        tz = get_local_tz()
+
         # Sunday night (last moment of week)
-        sunday_night = datetime(2025, 10, 19, 23, 59, 0, tzinfo=timezone.utc)
+        sunday_night = datetime(2025, 10, 19, 23, 59, 0, tzinfo=tz)
         mon1, sun1 = week_start_end_local(sunday_night)
         
         # Monday morning (first moment of next week)
-        monday_morning = datetime(2025, 10, 20, 0, 1, 0, tzinfo=timezone.utc)
+        monday_morning = datetime(2025, 10, 20, 0, 1, 0, tzinfo=tz)
         mon2, sun2 = week_start_end_local(monday_morning)
         
         # Should be different weeks
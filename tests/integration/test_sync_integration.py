@@ -3,12 +3,13 @@ Integration tests for Canvas sync functionality.
 Tests the complete sync workflow from API to database.
 """
 
+import asyncio
 import unittest
-import os
 from unittest.mock import patch, AsyncMock
 from datetime import datetime, timezone, timedelta
 import aiosqlite
 from utils.sync import sync_canvas_data
+from canvas_api.client import CanvasAPIError
 from database.db_manager import init_db
 from utils.datetime_utils import to_utc_iso_z
 
@@ -16,16 +17,10 @@ from utils.datetime_utils import to_utc_iso_z
 class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
     """Integration tests for Canvas data synchronization."""
 
-    @classmethod
-    def setUpClass(cls):
-        """Set up test database path."""
-        cls.test_db_path = "data/test_sync_bot.db"
-
     async def asyncSetUp(self):
-        """Initialize fresh database for each test."""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        
+        """Initialize a fresh in-memory database for each test."""
+        self.test_db_path = f"file:memdb_{id(self)}?mode=memory&cache=shared"
+
         import database.db_manager as db_manager
         self.original_db_path = db_manager.DB_PATH
         db_manager.DB_PATH = self.test_db_path
@@ -35,13 +30,12 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
     async def asyncTearDown(self):
         """Clean up test database."""
         import database.db_manager as db_manager
+        # Closing the last connection drops the in-memory database
+        await db_manager.close_db()
         db_manager.DB_PATH = self.original_db_path
-        
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
 
-    @patch('utils.sync.get_courses')
-    @patch('utils.sync.get_assignments')
+    @patch('utils.sync.get_courses_async', new_callable=AsyncMock)
+    @patch('utils.sync.get_assignments_async', new_callable=AsyncMock)
     async def test_full_sync_workflow(self, mock_get_assignments, mock_get_courses):
         """Test complete sync from Canvas API to database."""
         # Mock Canvas API responses
@@ -96,7 +90,7 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
         await sync_canvas_data()
 
         # Verify courses were synced
-        async with aiosqlite.connect(self.test_db_path) as db:
+        async with aiosqlite.connect(self.test_db_path, uri=True) as db:
             async with db.execute("SELECT COUNT(*) FROM courses") as cursor:
                 count = (await cursor.fetchone())[0]
                 self.assertEqual(count, 2)
@@ -123,8 +117,8 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
                 count = (await cursor.fetchone())[0]
                 self.assertEqual(count, 2)
 
-    @patch('utils.sync.get_courses')
-    @patch('utils.sync.get_assignments')
+    @patch('utils.sync.get_courses_async', new_callable=AsyncMock)
+    @patch('utils.sync.get_assignments_async', new_callable=AsyncMock)
     async def test_sync_updates_existing_data(self, mock_get_assignments, mock_get_courses):
         """Test that sync updates existing courses and assignments."""
         # First sync
@@ -151,7 +145,7 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
         await sync_canvas_data()
 
         # Verify initial data
-        async with aiosqlite.connect(self.test_db_path) as db:
+        async with aiosqlite.connect(self.test_db_path, uri=True) as db:
             async with db.execute(
                 "SELECT name FROM assignments WHERE id = ?",
                 (3001,)
@@ -173,7 +167,7 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
         await sync_canvas_data()
 
         # Verify data was updated
-        async with aiosqlite.connect(self.test_db_path) as db:
+        async with aiosqlite.connect(self.test_db_path, uri=True) as db:
             async with db.execute(
                 "SELECT name, due_at FROM assignments WHERE id = ?",
                 (3001,)
@@ -182,8 +176,8 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
                 self.assertEqual(row[0], "Updated Assignment")
                 self.assertIn("2025-12-15", row[1])
 
-    @patch('utils.sync.get_courses')
-    @patch('utils.sync.get_assignments')
+    @patch('utils.sync.get_courses_async', new_callable=AsyncMock)
+    @patch('utils.sync.get_assignments_async', new_callable=AsyncMock)
     async def test_sync_handles_no_assignments(self, mock_get_assignments, mock_get_courses):
         """Test sync when a course has no assignments."""
         mock_get_courses.return_value = [
@@ -202,7 +196,7 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
         await sync_canvas_data()
 
         # Verify course was created
-        async with aiosqlite.connect(self.test_db_path) as db:
+        async with aiosqlite.connect(self.test_db_path, uri=True) as db:
             async with db.execute(
                 "SELECT COUNT(*) FROM courses WHERE id = ?",
                 (401,)
@@ -218,8 +212,55 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
                 count = (await cursor.fetchone())[0]
                 self.assertEqual(count, 0)
 
-    @patch('utils.sync.get_courses')
-    @patch('utils.sync.get_assignments')
+    @patch('utils.sync.get_courses_async', new_callable=AsyncMock)
+    @patch('utils.sync.get_assignments_async', new_callable=AsyncMock)
+    async def test_sync_reports_failed_courses(self, mock_get_assignments, mock_get_courses):
+        """Test that a failed course fetch is reported after the other courses are stored."""
+        mock_get_courses.return_value = [
+            {"id": 501, "name": "Working Course", "course_code": "OK101", "start_at": None, "end_at": None},
+            {"id": 502, "name": "Broken Course", "course_code": "BAD101", "start_at": None, "end_at": None},
+        ]
+        mock_get_assignments.side_effect = [
+            [{"id": 1, "name": "Stored", "due_at": None, "html_url": None, "has_submitted_submissions": False}],
+            CanvasAPIError("boom"),
+        ]
+
+        with self.assertRaisesRegex(CanvasAPIError, "1 of 2"):
+            await sync_canvas_data()
+
+        async with aiosqlite.connect(self.test_db_path, uri=True) as db:
+            async with db.execute("SELECT COUNT(*) FROM assignments WHERE course_id = 501") as cursor:
+                self.assertEqual((await cursor.fetchone())[0], 1)
+
+    @patch('utils.sync.get_courses_async', new_callable=AsyncMock)
+    @patch('utils.sync.get_assignments_async', new_callable=AsyncMock)
+    async def test_sync_propagates_cancellation(self, mock_get_assignments, mock_get_courses):
+        """Test that a cancelled course fetch cancels the sync instead of being stored."""
+        mock_get_courses.return_value = [
+            {"id": 601, "name": "Course", "course_code": "C601", "start_at": None, "end_at": None},
+        ]
+        mock_get_assignments.side_effect = asyncio.CancelledError()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await sync_canvas_data()
+
+    @patch('utils.sync.get_courses_async', new_callable=AsyncMock)
+    @patch('utils.sync.get_assignments_async', new_callable=AsyncMock)
+    async def test_sync_propagates_non_exception_errors(self, mock_get_assignments, mock_get_courses):
+        """Test that a BaseException other than Exception is re-raised, not reported as a failed course."""
+        class Shutdown(BaseException):
+            pass
+
+        mock_get_courses.return_value = [
+            {"id": 602, "name": "Course", "course_code": "C602", "start_at": None, "end_at": None},
+        ]
+        mock_get_assignments.side_effect = Shutdown()
+
+        with self.assertRaises(Shutdown):
+            await sync_canvas_data()
+
+    @patch('utils.sync.get_courses_async', new_callable=AsyncMock)
+    @patch('utils.sync.get_assignments_async', new_callable=AsyncMock)
     async def test_sync_preserves_user_data(self, mock_get_assignments, mock_get_courses):
         """Test that sync doesn't affect user-specific data like study plans."""
         # Setup initial data
@@ -246,7 +287,7 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
         await sync_canvas_data()
 
         # Add user study plan
-        async with aiosqlite.connect(self.test_db_path) as db:
+        async with aiosqlite.connect(self.test_db_path, uri=True) as db:
             planned_time = datetime.now(timezone.utc) + timedelta(days=5)
             await db.execute("""
                 INSERT INTO study_plans (user_id, course_id, assignment_id, planned_at_utc, notes)
@@ -258,7 +299,7 @@ class TestSyncIntegration(unittest.IsolatedAsyncioTestCase):
         await sync_canvas_data()
 
         # Verify study plan still exists
-        async with aiosqlite.connect(self.test_db_path) as db:
+        async with aiosqlite.connect(self.test_db_path, uri=True) as db:
             async with db.execute(
                 "SELECT COUNT(*) FROM study_plans WHERE user_id = ?",
                 ("test_user",)
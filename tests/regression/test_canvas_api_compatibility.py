@@ -3,12 +3,25 @@ Regression tests for Canvas API compatibility.
 Ensures API client continues to work with Canvas API responses.
 """
 
+import json
 import unittest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 from canvas_api.client import CanvasClient
 from canvas_api.endpoints import get_courses, get_assignments
 
 
+def _json_response(payload, link: str = "") -> SimpleNamespace:
+    """Build a plain stand-in for requests.Response; cheaper than a Mock graph."""
+    return SimpleNamespace(
+        status_code=200,
+        content=json.dumps(payload).encode(),
+        json=lambda: payload,
+        headers={"Link": link} if link else {},
+        raise_for_status=lambda: None,
+    )
+
+
 class TestCanvasAPIRegression(unittest.TestCase):
     """Regression tests for Canvas API behavior."""
 
@@ -19,16 +32,14 @@ class TestCanvasAPIRegression(unittest.TestCase):
         """
         client = CanvasClient(base_url="https://test.canvas.com", token="test")
         
-        with patch('canvas_api.client.requests.get') as mock_get:
+        with patch('canvas_api.client.requests.Session.get') as mock_get:
             # First page
-            mock_response1 = Mock()
-            mock_response1.json.return_value = [{"id": 1}]
-            mock_response1.headers.get.return_value = '<https://test.canvas.com/api/v1/courses?page=2>; rel="next"'
+            mock_response1 = _json_response(
+                [{"id": 1}], '<https://test.canvas.com/api/v1/courses?page=2>; rel="next"'
+            )
             
             # Second page
-            mock_response2 = Mock()
-            mock_response2.json.return_value = [{"id": 2}]
-            mock_response2.headers.get.return_value = ""
+            mock_response2 = _json_response([{"id": 2}])
             
             mock_get.side_effect = [mock_response1, mock_response2]
             
@@ -43,11 +54,8 @@ class TestCanvasAPIRegression(unittest.TestCase):
         """
         client = CanvasClient(base_url="https://test.canvas.com", token="test")
         
-        with patch('canvas_api.client.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = []
-            mock_response.headers.get.return_value = ""
-            mock_get.return_value = mock_response
+        with patch('canvas_api.client.requests.Session.get') as mock_get:
+            mock_get.return_value = _json_response([])
             
             client.get("courses")
             
@@ -133,11 +141,8 @@ class TestCanvasAPIRegression(unittest.TestCase):
         """
         client = CanvasClient(base_url="https://test.canvas.com", token="test")
         
-        with patch('canvas_api.client.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {"id": 123, "name": "Single Course"}
-            mock_response.headers.get.return_value = ""
-            mock_get.return_value = mock_response
+        with patch('canvas_api.client.requests.Session.get') as mock_get:
+            mock_get.return_value = _json_response({"id": 123, "name": "Single Course"})
             
             result = client.get("courses/123")
             
@@ -150,11 +155,8 @@ class TestCanvasAPIRegression(unittest.TestCase):
         """
         client = CanvasClient(base_url="https://test.canvas.com", token="test")
         
-        with patch('canvas_api.client.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = []
-            mock_response.headers.get.return_value = ""
-            mock_get.return_value = mock_response
+        with patch('canvas_api.client.requests.Session.get') as mock_get:
+            mock_get.return_value = _json_response([])
             
             client.get("courses")
             
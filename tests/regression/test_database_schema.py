@@ -3,8 +3,11 @@ Regression tests for database schema and operations.
 Ensures critical database functionality remains stable.
 """
 
+import asyncio
 import unittest
 import os
+import uuid
+from pathlib import Path
 import aiosqlite
 from datetime import datetime, timezone, timedelta
 import database.db_manager as db_manager
@@ -12,142 +15,267 @@ from database.db_manager import init_db
 from utils.datetime_utils import to_utc_iso_z
 
 
-class TestDatabaseSchemaRegression(unittest.IsolatedAsyncioTestCase):
-    """Regression tests for database schema stability."""
+class SharedLoopTestCase(unittest.TestCase):
+    """
+    Like IsolatedAsyncioTestCase, but every test in the class runs on one
+    event loop instead of a new loop per test. Only for tests that close
+    everything they open, so nothing carries over between them.
+    """
 
     @classmethod
     def setUpClass(cls):
-        """Set up test database path."""
-        cls.test_db_path = "data/test_regression_db.db"
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.run_until_complete(cls.loop.shutdown_asyncgens())
+        cls.loop.close()
+
+    def setUp(self):
+        self.loop.run_until_complete(self.asyncSetUp())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.asyncTearDown())
 
     async def asyncSetUp(self):
-        """Initialize fresh database for each test."""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        
+        pass
+
+    async def asyncTearDown(self):
+        pass
+
+    def _callTestMethod(self, method):
+        result = method()
+        if asyncio.iscoroutine(result):
+            self.loop.run_until_complete(result)
+
+
+class TestDatabaseSchemaRegression(SharedLoopTestCase):
+    """Regression tests for database schema stability."""
+
+    async def asyncSetUp(self):
+        """Initialize a fresh in-memory database for each test."""
+        # Schema checks need no file on disk; the name is unique per test
+        self.test_db_path = f"file:regression_{uuid.uuid4().hex}?mode=memory&cache=shared"
         self.original_db_path = db_manager.DB_PATH
         db_manager.DB_PATH = self.test_db_path
         await init_db()
+        # One inspection connection per test instead of one per query;
+        # rows are addressed by column name, e.g. col['pk'] from table_info
+        self.db = await aiosqlite.connect(self.test_db_path, uri=True)
+        self.db.row_factory = aiosqlite.Row
 
     async def asyncTearDown(self):
         """Clean up test database."""
+        # Closing the last connection drops the in-memory database
+        await self.db.close()
+        await db_manager.close_db()
         db_manager.DB_PATH = self.original_db_path
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
+
+    async def _columns(self, table: str) -> list:
+        """PRAGMA table_info rows for table."""
+        async with self.db.execute(f"PRAGMA table_info({table})") as cursor:
+            return await cursor.fetchall()
 
     async def test_assignments_table_has_composite_primary_key(self):
         """
         REGRESSION: Assignments table should use composite PK (course_id, id).
         Early versions used single-column PK which caused issues with cross-course ID collisions.
         """
-        async with aiosqlite.connect(self.test_db_path) as db:
-            async with db.execute("PRAGMA table_info(assignments)") as cursor:
-                columns = await cursor.fetchall()
-                
-            # Get primary key columns
-            pk_columns = [col[1] for col in columns if col[5] > 0]
-            
-            # Should have composite key
-            self.assertEqual(len(pk_columns), 2, "Should have 2 PK columns")
-            self.assertIn('course_id', pk_columns)
-            self.assertIn('id', pk_columns)
+        columns = await self._columns("assignments")
+
+        # Get primary key columns
+        pk_columns = [col['name'] for col in columns if col['pk'] > 0]
+        
+        # Should have composite key
+        self.assertEqual(len(pk_columns), 2, "Should have 2 PK columns")
+        self.assertIn('course_id', pk_columns)
+        self.assertIn('id', pk_columns)
 
     async def test_assignments_table_has_due_reminder_columns(self):
         """
         REGRESSION: Assignments table should have due date reminder tracking columns.
         These were added via migration.
         """
-        async with aiosqlite.connect(self.test_db_path) as db:
-            async with db.execute("PRAGMA table_info(assignments)") as cursor:
-                columns = await cursor.fetchall()
-                
-            column_names = [col[1] for col in columns]
-            
-            self.assertIn('due_reminder_2d_sent', column_names)
-            self.assertIn('due_reminder_1d_sent', column_names)
-            self.assertIn('due_reminder_12h_sent', column_names)
+        columns = await self._columns("assignments")
+
+        column_names = {col['name'] for col in columns}
+        
+        self.assertIn('due_reminder_2d_sent', column_names)
+        self.assertIn('due_reminder_1d_sent', column_names)
+        self.assertIn('due_reminder_12h_sent', column_names)
 
     async def test_study_plans_requires_course_id(self):
         """
         REGRESSION: Study plans table should require course_id (NOT NULL).
         Early tests failed because course_id was missing.
         """
-        async with aiosqlite.connect(self.test_db_path) as db:
-            async with db.execute("PRAGMA table_info(study_plans)") as cursor:
-                columns = await cursor.fetchall()
-                
-            course_id_col = [col for col in columns if col[1] == 'course_id'][0]
-            
-            # col[3] is the NOT NULL flag
-            self.assertEqual(course_id_col[3], 1, "course_id should be NOT NULL")
+        columns = await self._columns("study_plans")
+
+        course_id_col = next((col for col in columns if col['name'] == 'course_id'), None)
+        
+        self.assertIsNotNone(course_id_col)
+        self.assertEqual(course_id_col['notnull'], 1, "course_id should be NOT NULL")
 
     async def test_study_plans_has_reminder_columns(self):
         """
         REGRESSION: Study plans should have reminder tracking columns.
         These were added via migration.
         """
-        async with aiosqlite.connect(self.test_db_path) as db:
-            async with db.execute("PRAGMA table_info(study_plans)") as cursor:
-                columns = await cursor.fetchall()
-                
-            column_names = [col[1] for col in columns]
-            
-            self.assertIn('reminder_24h_sent', column_names)
-            self.assertIn('reminder_1h_sent', column_names)
-            self.assertIn('reminder_now_sent', column_names)
+        columns = await self._columns("study_plans")
+
+        column_names = {col['name'] for col in columns}
+        
+        self.assertIn('reminder_24h_sent', column_names)
+        self.assertIn('reminder_1h_sent', column_names)
+        self.assertIn('reminder_now_sent', column_names)
 
     async def test_assignments_column_name_is_due_at(self):
         """
         REGRESSION: The due date column is 'due_at', not 'due_at_utc'.
         Early integration tests used wrong column name.
         """
-        async with aiosqlite.connect(self.test_db_path) as db:
-            async with db.execute("PRAGMA table_info(assignments)") as cursor:
-                columns = await cursor.fetchall()
-                
-            column_names = [col[1] for col in columns]
-            
-            self.assertIn('due_at', column_names)
-            self.assertNotIn('due_at_utc', column_names)
+        columns = await self._columns("assignments")
+
+        column_names = {col['name'] for col in columns}
+        
+        self.assertIn('due_at', column_names)
+        self.assertNotIn('due_at_utc', column_names)
 
     async def test_foreign_key_constraints_exist(self):
         """
         REGRESSION: Ensure foreign key constraints are properly defined.
         """
-        async with aiosqlite.connect(self.test_db_path) as db:
-            # Check assignments -> courses FK
-            async with db.execute("PRAGMA foreign_key_list(assignments)") as cursor:
-                fks = await cursor.fetchall()
-                
-            self.assertGreater(len(fks), 0, "Assignments should have foreign key to courses")
+        # Check assignments -> courses FK
+        async with self.db.execute("PRAGMA foreign_key_list(assignments)") as cursor:
+            fks = await cursor.fetchall()
             
-            # Verify it references courses table
-            course_fk = [fk for fk in fks if fk[2] == 'courses']
-            self.assertGreater(len(course_fk), 0, "Should reference courses table")
+        self.assertGreater(len(fks), 0, "Assignments should have foreign key to courses")
+        
+        # Verify it references courses table
+        self.assertTrue(any(fk['table'] == 'courses' for fk in fks), "Should reference courses table")
+
+    async def test_weekly_plan_lookup_uses_index(self):
+        """
+        REGRESSION: Looking up a user's plans for a week should seek the
+        (user_id, planned_at_utc) index instead of scanning study_plans.
+        """
+        async with self.db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM study_plans "
+            "WHERE user_id = ? AND planned_at_utc BETWEEN ? AND ?",
+            ("user", "2025-01-06T05:00:00Z", "2025-01-13T04:59:59Z"),
+        ) as cursor:
+            plan = " ".join(row['detail'] for row in await cursor.fetchall())
 
+        self.assertIn("idx_study_plans_user_planned", plan)
 
-class TestDatabaseOperationsRegression(unittest.IsolatedAsyncioTestCase):
-    """Regression tests for database operation behavior."""
+    async def test_weekly_assignment_lookup_uses_due_at_index(self):
+        """
+        REGRESSION: The weekly assignment listing should seek the due_at index
+        instead of scanning every synced assignment.
+        """
+        async with self.db.execute(
+            "EXPLAIN QUERY PLAN SELECT a.id, a.course_id, a.name, a.due_at, c.name, c.course_code "
+            "FROM assignments a JOIN courses c ON a.course_id = c.id "
+            "WHERE a.due_at BETWEEN ? AND ? ORDER BY a.due_at",
+            ("2025-01-06T05:00:00Z", "2025-01-13T04:59:59Z"),
+        ) as cursor:
+            plan = " ".join(row['detail'] for row in await cursor.fetchall())
 
-    @classmethod
-    def setUpClass(cls):
-        """Set up test database path."""
-        cls.test_db_path = "data/test_regression_ops_db.db"
+        self.assertIn("idx_assignments_due_at", plan)
+
+    async def test_week_status_lookup_uses_status_primary_key(self):
+        """
+        REGRESSION: Weekly status lookups reach user_assignment_status through its
+        primary key, and no unused partial index is left to slow down writes.
+        """
+        async with self.db.execute(
+            "EXPLAIN QUERY PLAN SELECT a.id FROM assignments a "
+            "LEFT JOIN user_assignment_status uas "
+            "ON uas.user_id = ? AND uas.course_id = a.course_id AND uas.assignment_id = a.id "
+            "WHERE a.due_at BETWEEN ? AND ? AND COALESCE(uas.completed, 0) = 0",
+            ("user", "2025-01-06T05:00:00Z", "2025-01-13T04:59:59Z"),
+        ) as cursor:
+            plan = " ".join(row['detail'] for row in await cursor.fetchall())
+        async with self.db.execute("PRAGMA index_list(user_assignment_status)") as cursor:
+            index_names = {idx['name'] for idx in await cursor.fetchall()}
+
+        self.assertIn("sqlite_autoindex_user_assignment_status_1", plan)
+        self.assertNotIn("idx_uas_incomplete", index_names)
+
+    async def test_init_db_records_schema_version(self):
+        """
+        REGRESSION: init_db should stamp PRAGMA user_version so migrations
+        are skipped on later startups.
+        """
+        async with self.db.execute("PRAGMA user_version") as cursor:
+            version = (await cursor.fetchone())[0]
+
+        self.assertEqual(version, db_manager.SCHEMA_VERSION)
+
+    async def test_legacy_single_pk_schema_is_rebuilt(self):
+        """
+        REGRESSION: Rebuilding the old single-column PK assignments table must
+        keep existing rows and the due date reminder columns.
+        """
+        # Start over from an empty database holding only the legacy table
+        await self.db.close()
+        await db_manager.close_db()
+        self.db = await aiosqlite.connect(self.test_db_path, uri=True)
+        self.db.row_factory = aiosqlite.Row
+        await self.db.execute("""
+            CREATE TABLE assignments (
+                id INTEGER PRIMARY KEY,
+                course_id INTEGER,
+                name TEXT NOT NULL,
+                due_at TEXT,
+                week_number INTEGER,
+                html_url TEXT,
+                submitted INTEGER DEFAULT 0
+            )
+        """)
+        await self.db.execute(
+            "INSERT INTO assignments (id, course_id, name) VALUES (?, ?, ?)",
+            (1, 10, "Legacy Assignment"),
+        )
+        await self.db.commit()
+
+        await init_db()
+
+        async with self.db.execute("PRAGMA table_info(assignments)") as cursor:
+            columns = await cursor.fetchall()
+        async with self.db.execute("SELECT name FROM assignments WHERE course_id = 10 AND id = 1") as cursor:
+            row = await cursor.fetchone()
+
+        pk_columns = [col['name'] for col in columns if col['pk'] > 0]
+        column_names = {col['name'] for col in columns}
+        self.assertEqual(sorted(pk_columns), ['course_id', 'id'])
+        self.assertIn('due_reminder_12h_sent', column_names)
+        self.assertEqual(row['name'], "Legacy Assignment")
+        async with self.db.execute("PRAGMA index_list(assignments)") as cursor:
+            self.assertIn("idx_assignments_due_at", {idx['name'] for idx in await cursor.fetchall()})
+
+
+class TestDatabaseOperationsRegression(unittest.IsolatedAsyncioTestCase):
+    """
+    Regression tests for database operation behavior. These stay on disk:
+    several of them check WAL files and read-only file connections.
+    """
 
     async def asyncSetUp(self):
         """Initialize fresh database for each test."""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        
+        # A file per test lets test runners spread these tests across processes
+        self.test_db_path = f"data/test_regression_ops_db_{uuid.uuid4().hex}.db"
         self.original_db_path = db_manager.DB_PATH
         db_manager.DB_PATH = self.test_db_path
         await init_db()
 
     async def asyncTearDown(self):
         """Clean up test database."""
+        await db_manager.close_db()
         db_manager.DB_PATH = self.original_db_path
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
+        # Remove the WAL and shared-memory files too, in case a test left them
+        for suffix in ("", "-wal", "-shm"):
+            Path(self.test_db_path + suffix).unlink(missing_ok=True)
 
     async def test_upsert_functions_use_list_api(self):
         """
@@ -165,6 +293,106 @@ class TestDatabaseOperationsRegression(unittest.IsolatedAsyncioTestCase):
         self.assertIn('assignments', assignments_sig.parameters)
         self.assertIn('course_id', assignments_sig.parameters)
 
+    async def test_read_connection_is_query_only(self):
+        """
+        REGRESSION: Read connections must never take write locks;
+        writes go through the read-write connection only.
+        """
+        import sqlite3
+
+        async with db_manager.acquire(read=True) as reader, db_manager.acquire() as writer:
+            self.assertIsNot(reader, writer)
+
+            with self.assertRaises(sqlite3.OperationalError):
+                await reader.execute("INSERT INTO courses (id, name) VALUES (1, 'Nope')")
+
+            async with writer.execute("PRAGMA journal_mode") as cursor:
+                self.assertEqual((await cursor.fetchone())[0], "wal")
+
+    async def test_concurrent_reads_use_separate_connections(self):
+        """
+        REGRESSION: Readers checked out at the same time must be distinct
+        connections so queries can run in parallel.
+        """
+        async with db_manager.acquire(read=True) as first, db_manager.acquire(read=True) as second:
+            self.assertIsNot(first, second)
+
+    async def test_upsert_assignments_normalizes_due_dates(self):
+        """
+        REGRESSION: Canvas 'Z' timestamps are stored as-is while other ISO
+        formats are normalized; both must get the correct ISO week number.
+        """
+        from database.db_manager import upsert_courses, upsert_assignments
+
+        await upsert_courses([{"id": 1, "name": "Course"}])
+        await upsert_assignments([
+            {"id": 1, "name": "Z format", "due_at": "2025-12-29T04:59:00Z"},
+            {"id": 2, "name": "Offset format", "due_at": "2025-12-29T04:59:00.000+00:00"},
+        ], 1)
+
+        async with aiosqlite.connect(self.test_db_path) as db:
+            async with db.execute("SELECT id, due_at, week_number FROM assignments ORDER BY id") as cursor:
+                rows = await cursor.fetchall()
+
+        self.assertEqual(rows[0], (1, "2025-12-29T04:59:00Z", 1))
+        self.assertEqual(rows[1], (2, "2025-12-29T04:59:00Z", 1))
+
+    async def test_db_maintenance_truncates_wal(self):
+        """
+        REGRESSION: Periodic maintenance should checkpoint the WAL back to
+        the database file without losing committed rows.
+        """
+        from database.db_manager import upsert_courses, get_courses, run_db_maintenance
+
+        await upsert_courses([{"id": 1, "name": "Course"}])
+        await run_db_maintenance()
+
+        self.assertEqual(os.path.getsize(self.test_db_path + "-wal"), 0)
+        self.assertEqual(len(await get_courses()), 1)
+
+    async def test_concurrent_writes_do_not_interleave(self):
+        """
+        REGRESSION: Writes issued concurrently share one connection and must
+        each commit as their own transaction without SQLITE_BUSY errors.
+        """
+        import asyncio
+        from database.db_manager import upsert_courses, get_courses
+
+        await asyncio.gather(*(
+            upsert_courses([{"id": i, "name": f"Course {i}"}]) for i in range(1, 11)
+        ))
+
+        self.assertEqual(len(await get_courses()), 10)
+
+    async def test_failed_write_is_rolled_back(self):
+        """
+        REGRESSION: An exception inside a write transaction should leave no
+        partial rows behind.
+        """
+        from database.db_manager import upsert_courses, get_courses
+
+        # The second row violates NOT NULL on name, so the failure happens
+        # inside the transaction after the first row has been written.
+        with self.assertRaises(aiosqlite.IntegrityError):
+            await upsert_courses([{"id": 1, "name": "Course"}, {"id": 2, "name": None}])
+
+        self.assertEqual(await get_courses(), [])
+
+    async def test_repeat_init_db_reuses_open_connections(self):
+        """
+        REGRESSION: Every sync calls init_db; after the first call it must keep
+        the same pool and writer rather than reconnecting.
+        """
+        async with db_manager.acquire() as first_writer:
+            pass
+        pool = db_manager._pool
+
+        await init_db()
+
+        async with db_manager.acquire() as second_writer:
+            self.assertIs(second_writer, first_writer)
+        self.assertIs(db_manager._pool, pool)
+
     async def test_db_path_comes_from_config(self):
         """
         REGRESSION: DB_PATH should be imported from config, not hardcoded.
@@ -14,6 +14,10 @@ from utils.datetime_utils import (
 )
 
 
+# Shared fixtures: a Canvas timestamp string and the datetime it denotes
+_CANVAS_STR = "2025-10-15T14:30:00Z"
+_CANVAS_DT = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)
+
 class TestDatetimeParsingRegression(unittest.TestCase):
     """Regression tests for datetime parsing stability."""
 
@@ -21,7 +25,7 @@ class TestDatetimeParsingRegression(unittest.TestCase):
         """
         REGRESSION: Ensure Canvas datetime strings with 'Z' suffix parse correctly.
         """
-        dt_str = "2025-10-15T14:30:00Z"
+        dt_str = _CANVAS_STR
         result = parse_canvas_datetime(dt_str)
         
         self.assertEqual(result.year, 2025)
@@ -35,7 +39,7 @@ class TestDatetimeParsingRegression(unittest.TestCase):
         """
         REGRESSION: to_utc_iso_z should always produce strings ending with 'Z'.
         """
-        dt = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)
+        dt = _CANVAS_DT
         result = to_utc_iso_z(dt)
         
         self.assertTrue(result.endswith('Z'))
@@ -58,7 +62,7 @@ class TestDatetimeParsingRegression(unittest.TestCase):
         """
         REGRESSION: week_start_end_local should return Monday start and Sunday end.
         """
-        ref = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)  # Wednesday
+        ref = _CANVAS_DT  # Wednesday
         monday, sunday = week_start_end_local(ref)
         
         self.assertEqual(monday.weekday(), 0)  # Monday
@@ -69,7 +73,7 @@ class TestDatetimeParsingRegression(unittest.TestCase):
         """
         REGRESSION: Week should start at Monday 00:00 and end at Sunday 23:59.
         """
-        ref = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)
+        ref = _CANVAS_DT
         monday, sunday = week_start_end_local(ref)
         
         self.assertEqual(monday.hour, 0)
@@ -91,7 +95,7 @@ class TestDatetimeParsingRegression(unittest.TestCase):
         """
         REGRESSION: Default format should include year for clarity.
         """
-        dt_str = "2025-10-15T14:30:00Z"
+        dt_str = _CANVAS_STR
         result = format_local(dt_str)
         
         self.assertIn("2025", result)
@@ -115,7 +119,7 @@ class TestTimezoneConsistencyRegression(unittest.TestCase):
         """
         REGRESSION: Canvas datetime -> parse -> to_utc_iso_z should preserve the time.
         """
-        original = "2025-10-15T14:30:00Z"
+        original = _CANVAS_STR
         parsed = parse_canvas_datetime(original)
         result = to_utc_iso_z(parsed)
         
@@ -125,7 +129,7 @@ class TestTimezoneConsistencyRegression(unittest.TestCase):
         """
         REGRESSION: to_local should always return timezone-aware datetime.
         """
-        dt_str = "2025-10-15T14:30:00Z"
+        dt_str = _CANVAS_STR
         result = to_local(dt_str)
         
         self.assertIsNotNone(result.tzinfo)
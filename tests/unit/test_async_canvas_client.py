@@ -0,0 +1,100 @@
+"""
+Unit tests for the asynchronous Canvas API client.
+Runs against a local aiohttp server to exercise pagination and error handling.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from aiohttp import web
+from canvas_api.async_client import AsyncCanvasClient
+from canvas_api.client import CanvasAPIError
+from canvas_api.endpoints import get_courses_async
+
+
+class TestAsyncCanvasClient(unittest.IsolatedAsyncioTestCase):
+    """Test suite for AsyncCanvasClient class."""
+
+    async def asyncSetUp(self):
+        """Start a local server that mimics Canvas pagination."""
+        self.course_requests = 0
+
+        async def courses(request):
+            self.course_requests += 1
+            if request.query.get("page") == "2":
+                return web.json_response([{"id": 2, "name": "Course 2"}])
+            next_url = f"{self.base_url}/courses?page=2"
+            return web.json_response(
+                [{"id": 1, "name": "Course 1"}],
+                headers={"Link": f'<{next_url}>; rel="next"'},
+            )
+
+        async def missing(request):
+            raise web.HTTPNotFound()
+
+        app = web.Application()
+        app.router.add_get("/courses", courses)
+        app.router.add_get("/missing", missing)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_get_follows_pagination(self):
+        """Test that all pages are fetched and combined."""
+        async with AsyncCanvasClient(base_url=self.base_url, token="test_token") as client:
+            result = await client.get("courses")
+
+        self.assertEqual([c["id"] for c in result], [1, 2])
+
+    async def test_get_courses_async_normalizes_all_pages(self):
+        """Test that courses from every page come back in the stored shape."""
+        async with AsyncCanvasClient(base_url=self.base_url, token="test_token") as client:
+            courses = await get_courses_async(client)
+
+        self.assertEqual([c["name"] for c in courses], ["Course 1", "Course 2"])
+        self.assertIsNone(courses[0]["course_code"])
+
+    async def test_duplicate_requests_share_one_fetch(self):
+        """Test that identical GETs in one session reach the server once."""
+        async with AsyncCanvasClient(base_url=self.base_url, token="test_token") as client:
+            first, second = await asyncio.gather(client.get("courses"), client.get("courses"))
+            first.append({"id": 99})
+            third = await client.get("courses")
+
+        self.assertEqual(self.course_requests, 2)  # both pages, fetched once
+        self.assertEqual([c["id"] for c in second], [1, 2])
+        self.assertEqual([c["id"] for c in third], [1, 2])
+
+        async with AsyncCanvasClient(base_url=self.base_url, token="test_token") as client:
+            await client.get("courses")
+        self.assertEqual(self.course_requests, 4)
+
+    async def test_get_decodes_with_stdlib_json_fallback(self):
+        """Test that bodies decode the same with and without orjson."""
+        from canvas_api import client as client_module
+        async with AsyncCanvasClient(base_url=self.base_url, token="test_token") as client:
+            with patch.object(client_module, "orjson", None):
+                result = await client.get("courses")
+
+        self.assertEqual([c["name"] for c in result], ["Course 1", "Course 2"])
+
+    async def test_http_error_raises_canvas_api_error(self):
+        """Test that HTTP errors surface as CanvasAPIError."""
+        async with AsyncCanvasClient(base_url=self.base_url, token="test_token") as client:
+            with self.assertRaises(CanvasAPIError):
+                await client.get("missing")
+
+    async def test_requires_context_manager(self):
+        """Test that requests outside 'async with' fail clearly."""
+        client = AsyncCanvasClient(base_url=self.base_url, token="test_token")
+        with self.assertRaises(RuntimeError):
+            await client.get("courses")
+
+
+if __name__ == "__main__":
+    unittest.main()
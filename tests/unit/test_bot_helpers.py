@@ -12,14 +12,19 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from bot import (
+    WORK_SESSION_REMINDER_LABELS,
+    DUE_DATE_REMINDER_LABELS,
+    DUE_DATE_REMINDER_MESSAGES,
+    parse_day_time_input
+)
+
 
 class TestBotHelpers(unittest.TestCase):
     """Test suite for bot helper functions."""
 
     def test_work_session_reminder_labels(self):
         """Test that work session reminder labels are defined."""
-        from bot import WORK_SESSION_REMINDER_LABELS
-        
         self.assertIn('24h', WORK_SESSION_REMINDER_LABELS)
         self.assertIn('1h', WORK_SESSION_REMINDER_LABELS)
         self.assertIn('now', WORK_SESSION_REMINDER_LABELS)
@@ -29,16 +34,12 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_due_date_reminder_labels(self):
         """Test that due date reminder labels are defined."""
-        from bot import DUE_DATE_REMINDER_LABELS
-        
         self.assertIn('2d', DUE_DATE_REMINDER_LABELS)
         self.assertIn('1d', DUE_DATE_REMINDER_LABELS)
         self.assertIn('12h', DUE_DATE_REMINDER_LABELS)
 
     def test_due_date_reminder_messages(self):
         """Test that due date reminder messages are defined."""
-        from bot import DUE_DATE_REMINDER_MESSAGES
-        
         self.assertIn('2d', DUE_DATE_REMINDER_MESSAGES)
         self.assertIn('1d', DUE_DATE_REMINDER_MESSAGES)
         self.assertIn('12h', DUE_DATE_REMINDER_MESSAGES)
@@ -49,8 +50,6 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_parse_day_time_input_valid(self):
         """Test parsing valid day/time input."""
-        from bot import parse_day_time_input
-        
         monday = datetime(2025, 10, 13, 0, 0, 0)  # Monday
         
         # Test Wednesday 7:30 PM
@@ -61,8 +60,6 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_parse_day_time_input_am(self):
         """Test parsing AM time."""
-        from bot import parse_day_time_input
-        
         monday = datetime(2025, 10, 13, 0, 0, 0)
         
         result = parse_day_time_input("Mon 9:00 AM", monday)
@@ -72,8 +69,6 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_parse_day_time_input_noon(self):
         """Test parsing 12 PM (noon)."""
-        from bot import parse_day_time_input
-        
         monday = datetime(2025, 10, 13, 0, 0, 0)
         
         result = parse_day_time_input("Fri 12:00 PM", monday)
@@ -83,8 +78,6 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_parse_day_time_input_midnight(self):
         """Test parsing 12 AM (midnight)."""
-        from bot import parse_day_time_input
-        
         monday = datetime(2025, 10, 13, 0, 0, 0)
         
         result = parse_day_time_input("Sat 12:00 AM", monday)
@@ -94,8 +87,6 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_parse_day_time_input_invalid_format(self):
         """Test that invalid format returns None."""
-        from bot import parse_day_time_input
-        
         monday = datetime(2025, 10, 13, 0, 0, 0)
         
         result = parse_day_time_input("Invalid input", monday)
@@ -103,8 +94,6 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_parse_day_time_input_invalid_day(self):
         """Test that invalid day name returns None."""
-        from bot import parse_day_time_input
-        
         monday = datetime(2025, 10, 13, 0, 0, 0)
         
         result = parse_day_time_input("XYZ 7:30 PM", monday)
@@ -112,8 +101,6 @@ class TestBotHelpers(unittest.TestCase):
 
     def test_parse_day_time_input_various_day_formats(self):
         """Test parsing different day name formats."""
-        from bot import parse_day_time_input
-        
         monday = datetime(2025, 10, 13, 0, 0, 0)
         
         # Full name
@@ -3,9 +3,24 @@ Unit tests for Canvas API client.
 Tests HTTP request handling, pagination, and error handling.
 """
 
+import json
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-from canvas_api.client import CanvasClient
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from canvas_api.client import CanvasClient, _next_link
+
+_NEXT_PAGE = '<https://test.canvas.com/courses?page=2>; rel="next"'
+
+
+def _page(payload, link: str = "") -> SimpleNamespace:
+    """Build a plain stand-in for one requests.Response page; cheaper than a Mock graph."""
+    return SimpleNamespace(
+        status_code=200,
+        content=json.dumps(payload).encode(),
+        json=lambda: payload,
+        headers={"Link": link} if link else {},
+        raise_for_status=lambda: None,
+    )
 
 
 class TestCanvasClient(unittest.TestCase):
@@ -25,29 +40,28 @@ class TestCanvasClient(unittest.TestCase):
         self.assertEqual(self.client.headers["Authorization"], "Bearer test_token")
         self.assertEqual(self.client.headers["Content-Type"], "application/json")
 
-    @patch('canvas_api.client.requests.get')
+    def test_session_sends_authorization_header(self):
+        """Test that the shared session carries the auth headers for every request."""
+        self.assertEqual(self.client._session.headers["Authorization"], "Bearer test_token")
+        self.assertEqual(self.client._session.headers["Content-Type"], "application/json")
+
+    @patch('canvas_api.client.requests.Session.get')
     def test_get_single_object(self, mock_get):
         """Test GET request returning a single object (non-list)."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"id": 123, "name": "Test Course"}
-        mock_response.headers.get.return_value = ""
-        mock_get.return_value = mock_response
+        mock_get.return_value = _page({"id": 123, "name": "Test Course"})
 
         result = self.client.get("courses/123")
 
         self.assertEqual(result, {"id": 123, "name": "Test Course"})
         mock_get.assert_called_once()
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
     def test_get_list_no_pagination(self, mock_get):
         """Test GET request returning a list without pagination."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_get.return_value = _page([
             {"id": 1, "name": "Course 1"},
             {"id": 2, "name": "Course 2"}
-        ]
-        mock_response.headers.get.return_value = ""
-        mock_get.return_value = mock_response
+        ])
 
         result = self.client.get("courses")
 
@@ -55,20 +69,13 @@ class TestCanvasClient(unittest.TestCase):
         self.assertEqual(result[0]["id"], 1)
         self.assertEqual(result[1]["id"], 2)
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
     def test_get_with_pagination(self, mock_get):
         """Test GET request with pagination (multiple pages)."""
-        # First page
-        mock_response1 = Mock()
-        mock_response1.json.return_value = [{"id": 1, "name": "Course 1"}]
-        mock_response1.headers.get.return_value = '<https://test.canvas.com/courses?page=2>; rel="next"'
-
-        # Second page
-        mock_response2 = Mock()
-        mock_response2.json.return_value = [{"id": 2, "name": "Course 2"}]
-        mock_response2.headers.get.return_value = ""
-
-        mock_get.side_effect = [mock_response1, mock_response2]
+        mock_get.side_effect = [
+            _page([{"id": 1, "name": "Course 1"}], _NEXT_PAGE),
+            _page([{"id": 2, "name": "Course 2"}]),
+        ]
 
         result = self.client.get("courses")
 
@@ -77,13 +84,40 @@ class TestCanvasClient(unittest.TestCase):
         self.assertEqual(result[1]["id"], 2)
         self.assertEqual(mock_get.call_count, 2)
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
+    def test_iter_get_fetches_pages_lazily(self, mock_get):
+        """Test that iter_get requests the next page only once the current one is used up."""
+        mock_get.side_effect = [_page([{"id": 1}, {"id": 2}], _NEXT_PAGE), _page([{"id": 3}])]
+
+        items = self.client.iter_get("courses")
+        self.assertEqual([next(items)["id"], next(items)["id"]], [1, 2])
+        self.assertEqual(mock_get.call_count, 1)
+
+        self.assertEqual([item["id"] for item in items], [3])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args_list[0].kwargs["params"]["per_page"], 100)
+
+    def test_next_link_picks_next_among_several_rels(self):
+        """Test that the rel="next" URL is found in a full Canvas Link header."""
+        header = (
+            '<https://test.canvas.com/courses?page=1>; rel="current",'
+            '<https://test.canvas.com/courses?page=2>; rel="next",'
+            '<https://test.canvas.com/courses?page=1>; rel="first",'
+            '<https://test.canvas.com/courses?page=3>; rel="last"'
+        )
+
+        self.assertEqual(_next_link(header), "https://test.canvas.com/courses?page=2")
+        self.assertIsNone(_next_link('<https://test.canvas.com/courses?page=3>; rel="last"'))
+        self.assertIsNone(_next_link(""))
+        self.assertEqual(
+            _next_link('<https://test.canvas.com/courses?page=2>;rel="next"'),
+            "https://test.canvas.com/courses?page=2",
+        )
+
+    @patch('canvas_api.client.requests.Session.get')
     def test_get_default_per_page(self, mock_get):
         """Test that default per_page parameter is added."""
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.headers.get.return_value = ""
-        mock_get.return_value = mock_response
+        mock_get.return_value = _page([])
 
         self.client.get("courses")
 
@@ -92,13 +126,10 @@ class TestCanvasClient(unittest.TestCase):
         self.assertIn("params", call_args.kwargs)
         self.assertEqual(call_args.kwargs["params"]["per_page"], 100)
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
     def test_get_custom_params(self, mock_get):
         """Test GET request with custom parameters."""
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.headers.get.return_value = ""
-        mock_get.return_value = mock_response
+        mock_get.return_value = _page([])
 
         self.client.get("courses", params={"enrollment_state": "active"})
 
@@ -107,20 +138,17 @@ class TestCanvasClient(unittest.TestCase):
         self.assertEqual(call_args.kwargs["params"]["enrollment_state"], "active")
         self.assertEqual(call_args.kwargs["params"]["per_page"], 100)
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
     def test_get_timeout_parameter(self, mock_get):
         """Test that timeout parameter is included in request."""
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.headers.get.return_value = ""
-        mock_get.return_value = mock_response
+        mock_get.return_value = _page([])
 
         self.client.get("courses")
 
         call_args = mock_get.call_args
         self.assertEqual(call_args.kwargs.get("timeout"), 30)
 
-    @patch('canvas_api.client.requests.get')
+    @patch('canvas_api.client.requests.Session.get')
     def test_get_raises_for_status(self, mock_get):
         """Test that HTTP errors are raised."""
         mock_response = Mock()
@@ -130,6 +158,70 @@ class TestCanvasClient(unittest.TestCase):
         with self.assertRaises(Exception):
             self.client.get("courses/999")
 
+    @patch('canvas_api.client.requests.Session.get')
+    def test_get_decodes_raw_bytes_with_orjson(self, mock_get):
+        """Test that the raw body is decoded by orjson when it is installed."""
+        from canvas_api import client as client_module
+        if client_module.orjson is None:
+            self.skipTest("orjson not installed")
+
+        mock_response = Mock()
+        mock_response.content = b'[{"id": 1, "name": "Course 1"}]'
+        mock_response.headers.get.return_value = ""
+        mock_get.return_value = mock_response
+
+        result = self.client.get("courses")
+
+        self.assertEqual(result, [{"id": 1, "name": "Course 1"}])
+        mock_response.json.assert_not_called()
+
+    @patch('canvas_api.client.requests.Session.get')
+    def test_get_revalidates_with_etag(self, mock_get):
+        """Test that a repeat GET sends If-None-Match and reuses data on 304."""
+        mock_response = _page([{"id": 1, "name": "Course 1"}])
+        mock_response.headers["ETag"] = '"abc"'
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+
+        mock_get.side_effect = [mock_response, not_modified]
+
+        first = self.client.get("courses")
+        second = self.client.get("courses")
+
+        self.assertEqual(second, first)
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"abc"')
+        not_modified.json.assert_not_called()
+
+
+    @patch('canvas_api.client.requests.Session.get')
+    def test_etag_replay_is_not_affected_by_caller_mutation(self, mock_get):
+        """Test that changing a returned item does not change what a later 304 replays."""
+        fresh = _page([{"id": 1, "name": "Course 1"}])
+        fresh.headers["ETag"] = '"abc"'
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [fresh, not_modified]
+
+        self.client.get("courses")[0]["name"] = "Changed"
+
+        self.assertEqual(self.client.get("courses"), [{"id": 1, "name": "Course 1"}])
+
+    @patch('canvas_api.client.CANVAS_ETAG_CACHE_SIZE', 2)
+    @patch('canvas_api.client.requests.Session.get')
+    def test_etag_cache_evicts_least_recently_used(self, mock_get):
+        """Test that the ETag cache stays bounded, dropping the least recently used entry."""
+        def tagged_page(*args, **kwargs):
+            page = _page([{"id": 1}])
+            page.headers["ETag"] = '"abc"'
+            return page
+        mock_get.side_effect = tagged_page
+
+        for endpoint in ("courses/1", "courses/2", "courses/3"):
+            self.client.get(endpoint)
+
+        cached_urls = [url for url, _ in self.client._etag_cache]
+        self.assertEqual(cached_urls, ["https://test.canvas.com/courses/2", "https://test.canvas.com/courses/3"])
 
 if __name__ == "__main__":
     unittest.main()
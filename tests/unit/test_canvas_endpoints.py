@@ -5,7 +5,7 @@ Tests course and assignment fetching with data validation.
 
 import unittest
 from unittest.mock import Mock, patch
-from canvas_api.endpoints import get_courses, get_assignments
+from canvas_api.endpoints import get_courses, get_assignments, iter_assignments
 
 
 class TestCanvasEndpoints(unittest.TestCase):
@@ -144,6 +144,25 @@ class TestCanvasEndpoints(unittest.TestCase):
 
         mock_get.assert_called_once_with("courses/456/assignments")
 
+    @patch('canvas_api.endpoints.canvas_client.iter_get')
+    def test_iter_assignments_normalizes_lazily(self, mock_iter_get):
+        """Test that iter_assignments filters and normalizes items as they stream in."""
+        mock_iter_get.return_value = iter([
+            {"id": 1001, "name": "Homework 1", "due_at": "2025-10-20T23:59:00Z"},
+            {"id": 1002},  # Missing name
+        ])
+
+        result = iter_assignments(789)
+
+        self.assertEqual(list(result), [{
+            "id": 1001,
+            "name": "Homework 1",
+            "due_at": "2025-10-20T23:59:00Z",
+            "html_url": None,
+            "has_submitted_submissions": False,
+        }])
+        mock_iter_get.assert_called_once_with("courses/789/assignments")
+
 
 if __name__ == "__main__":
     unittest.main()
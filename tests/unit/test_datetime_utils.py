@@ -6,13 +6,16 @@ Tests timezone conversions, Canvas datetime parsing, and week calculations.
 import unittest
 from datetime import datetime, timezone, timedelta
 import os
+from unittest.mock import patch
 from utils.datetime_utils import (
     get_local_tz,
     parse_canvas_datetime,
     to_utc_iso_z,
     to_local,
     format_local,
-    week_start_end_local
+    week_start_end_local,
+    clear_cache,
+    _invalidate_local_tz
 )
 
 try:
@@ -21,12 +24,16 @@ except ImportError:
     ZoneInfo = None
 
 
+# Shared fixtures: a Canvas timestamp string and the datetime it denotes
+_CANVAS_STR = "2025-10-15T14:30:00Z"
+_CANVAS_DT = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)
+
 class TestDatetimeUtils(unittest.TestCase):
     """Test suite for datetime utility functions."""
 
     def test_parse_canvas_datetime_with_z(self):
         """Test parsing Canvas datetime string with 'Z' suffix."""
-        canvas_dt = "2025-10-15T14:30:00Z"
+        canvas_dt = _CANVAS_STR
         result = parse_canvas_datetime(canvas_dt)
         
         self.assertEqual(result.year, 2025)
@@ -45,6 +52,31 @@ class TestDatetimeUtils(unittest.TestCase):
         self.assertEqual(result.hour, 14)
         self.assertEqual(result.tzinfo, timezone.utc)
 
+    def test_parse_canvas_datetime_is_memoized(self):
+        """Test that repeat parses reuse the cached result until clear_cache()."""
+        first = parse_canvas_datetime(_CANVAS_STR)
+        self.assertIs(parse_canvas_datetime(_CANVAS_STR), first)
+
+        clear_cache()
+        self.assertIsNot(parse_canvas_datetime(_CANVAS_STR), first)
+
+    def test_parse_canvas_datetime_stdlib_fallback(self):
+        """Test the fromisoformat path used when ciso8601 is not installed."""
+        for accepts_z in (True, False):
+            with patch('utils.datetime_utils._fast_parse_datetime', None), \
+                 patch('utils.datetime_utils._FROMISOFORMAT_ACCEPTS_Z', accepts_z):
+                clear_cache()
+                self.addCleanup(clear_cache)
+
+                self.assertEqual(
+                    parse_canvas_datetime(_CANVAS_STR),
+                    datetime(2025, 10, 15, 14, 30, tzinfo=timezone.utc),
+                )
+                self.assertEqual(
+                    parse_canvas_datetime("2025-10-15T09:30:00-05:00"),
+                    datetime(2025, 10, 15, 14, 30, tzinfo=timezone.utc),
+                )
+
     def test_parse_canvas_datetime_empty_raises_error(self):
         """Test that empty string raises ValueError."""
         with self.assertRaises(ValueError):
@@ -52,7 +84,7 @@ class TestDatetimeUtils(unittest.TestCase):
 
     def test_to_utc_iso_z_aware_datetime(self):
         """Test converting timezone-aware datetime to UTC ISO string."""
-        dt = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)
+        dt = _CANVAS_DT
         result = to_utc_iso_z(dt)
         
         self.assertEqual(result, "2025-10-15T14:30:00Z")
@@ -75,9 +107,17 @@ class TestDatetimeUtils(unittest.TestCase):
         self.assertEqual(result, "2025-10-15T14:30:00Z")
         self.assertNotIn("123456", result)
 
+    @unittest.skipIf(ZoneInfo is None, "zoneinfo not available")
+    def test_to_utc_iso_z_local_offset_across_dst(self):
+        """Test that aware local datetimes use the offset in effect on their own date."""
+        tz = ZoneInfo("America/New_York")
+
+        self.assertEqual(to_utc_iso_z(datetime(2025, 3, 8, 12, 0, tzinfo=tz)), "2025-03-08T17:00:00Z")
+        self.assertEqual(to_utc_iso_z(datetime(2025, 3, 10, 12, 0, tzinfo=tz)), "2025-03-10T16:00:00Z")
+
     def test_to_local_with_string(self):
         """Test converting Canvas datetime string to local time."""
-        canvas_dt = "2025-10-15T14:30:00Z"
+        canvas_dt = _CANVAS_STR
         result = to_local(canvas_dt)
         
         self.assertIsNotNone(result.tzinfo)
@@ -85,7 +125,7 @@ class TestDatetimeUtils(unittest.TestCase):
 
     def test_to_local_with_datetime(self):
         """Test converting datetime object to local time."""
-        dt = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)
+        dt = _CANVAS_DT
         result = to_local(dt)
         
         self.assertIsNotNone(result.tzinfo)
@@ -95,7 +135,7 @@ class TestDatetimeUtils(unittest.TestCase):
 
     def test_format_local_default_format(self):
         """Test formatting datetime with default format."""
-        canvas_dt = "2025-10-15T14:30:00Z"
+        canvas_dt = _CANVAS_STR
         result = format_local(canvas_dt)
         
         # Default format: "%b %d, %Y, %I:%M %p"
@@ -105,7 +145,7 @@ class TestDatetimeUtils(unittest.TestCase):
 
     def test_format_local_custom_format(self):
         """Test formatting datetime with custom format."""
-        canvas_dt = "2025-10-15T14:30:00Z"
+        canvas_dt = _CANVAS_STR
         result = format_local(canvas_dt, "%Y-%m-%d")
         
         self.assertEqual(result, "2025-10-15")
@@ -126,7 +166,7 @@ class TestDatetimeUtils(unittest.TestCase):
     def test_week_start_end_local_wednesday(self):
         """Test week calculation when reference is Wednesday."""
         # Wednesday, October 15, 2025
-        ref = datetime(2025, 10, 15, 14, 30, 0, tzinfo=timezone.utc)
+        ref = _CANVAS_DT
         monday, sunday = week_start_end_local(ref)
         
         self.assertEqual(monday.weekday(), 0)  # Monday
@@ -142,6 +182,22 @@ class TestDatetimeUtils(unittest.TestCase):
         self.assertEqual(monday.day, 13)  # Monday Oct 13
         self.assertEqual(sunday.day, 19)  # Sunday Oct 19
 
+    def test_week_start_end_local_converts_aware_reference(self):
+        """Test that an aware reference in another zone is placed in the local week."""
+        try:
+            ZoneInfo("America/New_York")
+        except Exception:
+            self.skipTest("IANA timezone data not available")
+
+        # 02:00 UTC on Monday Oct 20 is still Sunday evening in New York
+        ref = datetime(2025, 10, 20, 2, 0, 0, tzinfo=timezone.utc)
+        with patch.dict(os.environ, {"TIMEZONE": "America/New_York"}):
+            monday, sunday = week_start_end_local(ref)
+
+        self.assertEqual(monday.day, 13)
+        self.assertEqual(sunday.day, 19)
+        self.assertEqual(monday.utcoffset(), timedelta(hours=-4))
+
     def test_week_start_end_local_no_reference(self):
         """Test week calculation with no reference (uses current time)."""
         monday, sunday = week_start_end_local()
@@ -152,9 +208,27 @@ class TestDatetimeUtils(unittest.TestCase):
 
     def test_get_local_tz_with_env_var(self):
         """Test getting local timezone from environment variable."""
-        # Skip: Environment variable behavior is difficult to test due to module caching
-        # and the fallback to system timezone. Manual testing recommended.
-        self.skipTest("Environment variable timezone testing requires isolation")
+        try:
+            ZoneInfo("America/Chicago")
+        except Exception:
+            self.skipTest("IANA timezone data not available")
+
+        with patch.dict(os.environ, {"TIMEZONE": "America/Chicago"}):
+            tz = get_local_tz()
+            self.assertEqual(str(tz), "America/Chicago")
+            # Resolved once, then served from the cache
+            self.assertIs(get_local_tz(), tz)
+
+        _invalidate_local_tz()
+
+    @unittest.skipIf(ZoneInfo is None, "zoneinfo not available")
+    def test_format_local_string_follows_timezone_change(self):
+        """Test that cached string renderings are not reused across timezones."""
+        value = _CANVAS_STR
+        with patch.dict(os.environ, {"TIMEZONE": "America/Chicago"}):
+            self.assertEqual(format_local(value, "%H:%M"), "09:30")
+        with patch.dict(os.environ, {"TIMEZONE": "Asia/Tokyo"}):
+            self.assertEqual(format_local(value, "%H:%M"), "23:30")
 
     def test_get_local_tz_fallback(self):
         """Test getting local timezone falls back to system timezone."""
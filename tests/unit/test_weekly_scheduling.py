@@ -0,0 +1,114 @@
+"""
+Unit tests for interactive weekly scheduling.
+Drives send_weekly_assignments with a stand-in Discord context.
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from constants import SCHEDULING_MAX_TIMEOUTS
+from utils.weekly import _pack_messages, send_weekly_assignments
+
+_WEEK_ROWS = [
+    (1, 101, "Essay", "2025-10-15T14:30:00Z", "Writing", "ENG101"),
+    (2, 102, "Lab Report", "2025-10-16T14:30:00Z", "Chemistry", "CHM101"),
+]
+
+
+def _context(*replies) -> SimpleNamespace:
+    """A command context whose author sends the given replies in order; exceptions are raised by wait_for."""
+    author = SimpleNamespace(id=42)
+    messages = [
+        reply if isinstance(reply, BaseException) else SimpleNamespace(content=reply, author=author)
+        for reply in replies
+    ]
+    return SimpleNamespace(
+        author=author,
+        channel=object(),
+        send=AsyncMock(),
+        bot=SimpleNamespace(wait_for=AsyncMock(side_effect=messages)),
+    )
+
+
+@patch('utils.weekly.upsert_study_plans', new_callable=AsyncMock)
+@patch('utils.weekly.get_assignments_for_week_with_ids', new_callable=AsyncMock, return_value=_WEEK_ROWS)
+class TestWeeklyScheduling(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the !thisweek scheduling conversation."""
+
+    async def test_multi_line_reply_schedules_all_in_one_write(self, mock_rows, mock_upsert):
+        """Test that one reply with a line per assignment is saved in a single batch."""
+        ctx = _context("Wed 7:30 PM\nThu 9:00 AM")
+
+        await send_weekly_assignments(ctx)
+
+        ctx.bot.wait_for.assert_awaited_once()
+        mock_rows.assert_awaited_once()
+        self.assertIn("Lab Report", ctx.send.await_args_list[0].args[0])
+        mock_upsert.assert_awaited_once()
+        plans = mock_upsert.await_args.args[0]
+        self.assertEqual([(p[1], p[2]) for p in plans], [(101, 1), (102, 2)])
+        self.assertTrue(all(p[0] == "42" and p[3].endswith("Z") for p in plans))
+
+    async def test_each_reply_is_saved_before_the_next_prompt(self, mock_rows, mock_upsert):
+        """Test that answering each prompt separately saves each answer right away."""
+        ctx = _context("Wed 7:30 PM", "Thu 9:00 AM")
+
+        await send_weekly_assignments(ctx)
+
+        self.assertEqual(ctx.bot.wait_for.await_count, 2)
+        self.assertEqual([len(c.args[0]) for c in mock_upsert.await_args_list], [1, 1])
+        sent = [c.args[0] for c in ctx.send.await_args_list]
+        saved = [i for i, m in enumerate(sent) if m.startswith("Saved plan")]
+        next_prompt = next(i for i, m in enumerate(sent) if m.startswith("Plan time for: Lab Report"))
+        self.assertEqual(len(saved), 2)
+        self.assertLess(saved[0], next_prompt)  # confirmed before moving on
+
+    async def test_error_mid_reply_still_saves_parsed_answers(self, mock_rows, mock_upsert):
+        """Test that answers from a reply are written even if the conversation fails partway."""
+        ctx = _context("Wed 7:30 PM\nsomeday")
+
+        async def send(text):
+            if text.startswith("Sorry"):
+                raise RuntimeError("connection lost")
+        ctx.send.side_effect = send
+
+        with self.assertRaises(RuntimeError):
+            await send_weekly_assignments(ctx)
+
+        mock_upsert.assert_awaited_once()
+        self.assertEqual(mock_upsert.await_args.args[0][0][2], 1)
+
+    async def test_stop_saves_plans_made_so_far(self, mock_rows, mock_upsert):
+        """Test that an invalid line re-asks for that assignment and stop keeps earlier plans."""
+        ctx = _context("Wed 7:30 PM\nsomeday", "stop")
+
+        await send_weekly_assignments(ctx)
+
+        mock_upsert.assert_awaited_once()
+        self.assertEqual(len(mock_upsert.await_args.args[0]), 1)
+        self.assertIn("Scheduling cancelled", ctx.send.await_args.args[0])
+
+    async def test_gives_up_after_repeated_timeouts(self, mock_rows, mock_upsert):
+        """Test that silence ends scheduling after a bounded number of prompts, keeping earlier plans."""
+        ctx = _context("Wed 7:30 PM", *(TimeoutError() for _ in range(SCHEDULING_MAX_TIMEOUTS)))
+
+        await send_weekly_assignments(ctx)
+
+        self.assertEqual(ctx.bot.wait_for.await_count, 1 + SCHEDULING_MAX_TIMEOUTS)
+        mock_upsert.assert_awaited_once()
+        self.assertIn("Timed out", ctx.send.await_args.args[0])
+
+
+class TestPackMessages(unittest.TestCase):
+    """Test suite for grouping Discord output into few messages."""
+
+    def test_packs_parts_up_to_the_limit(self):
+        """Test that parts share a message until the next one would overflow it."""
+        messages = _pack_messages(["aaaa", "bbbb", "cccc"], sep="\n", limit=9)
+
+        self.assertEqual(messages, ["aaaa\nbbbb", "cccc"])
+        self.assertEqual(_pack_messages([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ from .datetime_utils import (
     to_local,
     format_local,
     week_start_end_local,
+    clear_cache,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     'to_local',
     'format_local',
     'week_start_end_local',
+    'clear_cache',
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone, timedelta, time
 from typing import Optional
 
 try:
@@ -9,7 +9,29 @@ try:
 except Exception:  # pragma: no cover
     ZoneInfo = None  # type: ignore
 
+import functools
 import os
+import sys
+
+try:
+    # Optional C parser; noticeably faster than fromisoformat plus 'Z' rewriting
+    from ciso8601 import parse_datetime as _fast_parse_datetime
+except ImportError:
+    _fast_parse_datetime = None
+
+_UTC = timezone.utc
+
+# Storage format for UTC timestamps, e.g. '2025-10-01T03:59:00Z'
+_ISO_Z_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02dZ"
+
+# Last second of a local day, as used for week end boundaries
+_END_OF_DAY = time(23, 59, 59)
+
+# Default rendering for dates shown to users, e.g. 'Oct 15, 2025, 10:30 AM'
+_DEFAULT_DISPLAY_FORMAT = "%b %d, %Y, %I:%M %p"
+
+# Python 3.11 taught fromisoformat the full ISO 8601 syntax, including 'Z'
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
 
 
 def get_local_tz():
@@ -21,38 +43,72 @@ def get_local_tz():
     """
     tz_env = os.getenv("TIMEZONE")
     if tz_env and ZoneInfo is not None:
-        try:
-            return ZoneInfo(tz_env)
-        except Exception:
-            pass
-    # Fallback to system local timezone
+        tz = _zoneinfo_for(tz_env)
+        if tz is not None:
+            return tz
+    # Fallback to system local timezone. Not cached: the offset it reports
+    # changes with DST.
     return datetime.now().astimezone().tzinfo or timezone.utc
 
 
+@functools.lru_cache(maxsize=8)
+def _zoneinfo_for(name: str):
+    """Resolve an IANA zone name once per process; None (also cached) if it is unknown."""
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+def _invalidate_local_tz() -> None:
+    """Forget resolved zones, e.g. after tzdata is updated or in tests."""
+    _zoneinfo_for.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_canvas_datetime(value: str) -> datetime:
     """
     Parse Canvas ISO8601 datetime strings into timezone-aware datetimes.
     Canvas typically returns UTC with 'Z'. Example: '2025-10-01T03:59:00Z'.
+    Results are cached: the same due dates are parsed on every sync and reminder check.
     """
     if not value:
         raise ValueError("Empty datetime string")
-    # Normalize trailing Z to +00:00 for fromisoformat
-    normalized = value.replace("Z", "+00:00")
-    dt = datetime.fromisoformat(normalized)
+    if _fast_parse_datetime is not None:
+        # ciso8601 understands 'Z' natively
+        dt = _fast_parse_datetime(value)
+        if dt.tzinfo is not None and dt.utcoffset() == timedelta(0):
+            # Keep UTC results comparable to the stdlib path's timezone.utc
+            dt = dt.replace(tzinfo=_UTC)
+    elif _FROMISOFORMAT_ACCEPTS_Z or not value.endswith("Z"):
+        dt = datetime.fromisoformat(value)
+    else:
+        # Normalize trailing Z to +00:00 for fromisoformat before 3.11
+        dt = datetime.fromisoformat(value[:-1] + "+00:00")
     # If naive, assume UTC (defensive)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=_UTC)
     return dt
 
 
+def clear_cache() -> None:
+    """Drop memoized parse and format results and resolved zones (e.g. in tests or after a long-running sync)."""
+    parse_canvas_datetime.cache_clear()
+    _format_local_str.cache_clear()
+    _invalidate_local_tz()
+
+
 def to_utc_iso_z(dt: datetime) -> str:
     """Convert any datetime to a UTC ISO8601 string with trailing 'Z'."""
     if dt.tzinfo is None:
         # Assume it's local time if naive; attach local tz then convert to UTC
         dt = dt.replace(tzinfo=get_local_tz())
-    dt_utc = dt.astimezone(timezone.utc)
-    # timespec='seconds' ensures we drop microseconds for consistent storage
-    return dt_utc.replace(tzinfo=timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    if dt.tzinfo is not _UTC:
+        # Already-UTC inputs (most reminder window bounds) skip the conversion
+        dt = dt.astimezone(_UTC)
+    # Formatting the fields directly drops microseconds for consistent storage
+    # and beats isoformat() plus slicing off the '+00:00' offset
+    return _ISO_Z_FORMAT % (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
 
 
 def to_local(dt_or_str: datetime | str) -> datetime:
@@ -69,23 +125,39 @@ def to_local(dt_or_str: datetime | str) -> datetime:
     return dt.astimezone(get_local_tz())
 
 
-def format_local(dt_or_str: datetime | str, fmt: str = "%b %d, %Y, %I:%M %p") -> str:
+def format_local(dt_or_str: datetime | str, fmt: str = _DEFAULT_DISPLAY_FORMAT) -> str:
     """Format a UTC datetime (or ISO string) in the local timezone using fmt."""
+    if isinstance(dt_or_str, str):
+        return _format_local_str(dt_or_str, fmt, get_local_tz())
     return to_local(dt_or_str).strftime(fmt)
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_local_str(value: str, fmt: str, tz) -> str:
+    """
+    Cached format_local for stored ISO strings: the same due dates and plan
+    times are rendered on every listing and reminder. Keyed on tz so a
+    TIMEZONE change never serves a stale rendering.
+    """
+    return parse_canvas_datetime(value).astimezone(tz).strftime(fmt)
+
+
 def week_start_end_local(reference: Optional[datetime] = None):
     """
-    Given a reference datetime (naive treated as local), return the Monday 00:00:00
-    and Sunday 23:59:59 in local timezone as aware datetimes.
+    Given a reference datetime (naive treated as local, aware converted to local),
+    return the Monday 00:00:00 and Sunday 23:59:59 of its local week as aware datetimes.
     """
-    ref = reference or datetime.now()
-    if ref.tzinfo is None:
-        ref = ref.replace(tzinfo=get_local_tz())
-    # Compute Monday 00:00 local
-    weekday = ref.weekday()  # Monday=0
-    monday = (ref.replace(hour=0, minute=0, second=0, microsecond=0) -
-              timedelta(days=weekday))
-    # Sunday 23:59:59 local
-    sunday = monday.replace(hour=23, minute=59, second=59) + timedelta(days=6)
+    local = get_local_tz()
+    if reference is None:
+        ref = datetime.now(local)
+    elif reference.tzinfo is None:
+        ref = reference.replace(tzinfo=local)
+    else:
+        # The week is the local one: 01:00 UTC on a Monday may still be Sunday here
+        ref = reference.astimezone(local)
+    # Work on the calendar date and build each boundary in one step; the
+    # wall-clock times stay correct across DST changes within the week
+    monday_date = ref.date() - timedelta(days=ref.weekday())  # Monday=0
+    monday = datetime.combine(monday_date, time.min, tzinfo=ref.tzinfo)
+    sunday = datetime.combine(monday_date + timedelta(days=6), _END_OF_DAY, tzinfo=ref.tzinfo)
     return monday, sunday
@@ -1,24 +1,55 @@
 """Canvas data synchronization utilities."""
 
-from canvas_api.endpoints import get_courses, get_assignments
-from database.db_manager import upsert_courses, upsert_assignments, init_db
+import asyncio
+from canvas_api.async_client import AsyncCanvasClient
+from canvas_api.client import CanvasAPIError
+from canvas_api.endpoints import get_courses_async, get_assignments_async
+from database.db_manager import upsert_courses, upsert_assignments_multi, init_db
 
 
 async def sync_canvas_data() -> None:
-    """Fetch all courses and assignments from Canvas and store in local database."""
+    """
+    Fetch all courses and assignments from Canvas and store in local database.
+    Raises CanvasAPIError after storing the rest if any course's assignments
+    could not be fetched.
+    """
     print("Syncing Canvas data...")
     
     # Ensure DB exists
     await init_db()
     
-    # Fetch and store courses
-    courses = get_courses()
-    await upsert_courses(courses)
+    # Fetch courses, then assignments for all courses concurrently, over one
+    # connection pool so the event loop is never blocked on HTTP
+    async with AsyncCanvasClient() as client:
+        courses = await get_courses_async(client)
+        await upsert_courses(courses)
 
-    # Fetch and store assignments for each course
-    for course in courses:
-        course_id = course["id"]
-        assignments = get_assignments(course_id)
-        await upsert_assignments(assignments, course_id)
+        course_ids = [course["id"] for course in courses]
+        results = await asyncio.gather(
+            *(get_assignments_async(cid, client) for cid in course_ids),
+            return_exceptions=True,
+        )
+
+    # A course that failed to fetch keeps its previously synced assignments;
+    # the rest are stored in one transaction
+    assignments_by_course = {}
+    failed = []
+    for cid, result in zip(course_ids, results):
+        if isinstance(result, Exception):
+            print(f"Failed to fetch assignments for course {cid}: {result}")
+            failed.append(cid)
+        elif isinstance(result, BaseException):
+            # Cancellation, KeyboardInterrupt and the like are not fetch failures
+            raise result
+        else:
+            assignments_by_course[cid] = result
+    await upsert_assignments_multi(assignments_by_course)
+
+    if failed:
+        # Don't report success when some courses could not be refreshed
+        raise CanvasAPIError(
+            f"Partial sync: assignments for {len(failed)} of {len(course_ids)} course(s) "
+            f"could not be fetched: {failed}"
+        )
 
     print("Canvas data synced successfully.")
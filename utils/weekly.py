@@ -3,17 +3,22 @@ Weekly assignment management utilities.
 """
 
 import discord
-import re
 from datetime import datetime, timedelta
 from typing import Tuple
 
 from database.db_manager import (
     get_assignments_for_week,
     get_assignments_for_week_with_ids,
-    upsert_study_plan
+    upsert_study_plans
 )
-from utils.datetime_utils import format_local, get_local_tz, to_utc_iso_z
-from constants import DAY_NAME_MAP, SCHEDULING_TIMEOUT
+from utils.datetime_utils import format_local, get_local_tz, to_utc_iso_z, week_start_end_local
+from constants import DAY_NAME_MAP, DAY_TIME_PATTERN, SCHEDULING_MAX_TIMEOUTS, SCHEDULING_TIMEOUT
+
+# Discord rejects messages over 2000 characters; leave some headroom
+_MESSAGE_LIMIT = 1900
+
+# Due dates in weekly listings and scheduling prompts, e.g. 'Wed Oct 15, 10:30 AM'
+_DUE_FORMAT = "%a %b %d, %I:%M %p"
 
 
 def _parse_day_time_input(input_str: str, week_monday: datetime) -> Tuple[datetime, None] | Tuple[None, str]:
@@ -22,12 +27,12 @@ def _parse_day_time_input(input_str: str, week_monday: datetime) -> Tuple[dateti
     
     Args:
         input_str: User input string (e.g., 'Wed 7:30 PM').
-        week_monday: The Monday of the current week.
+        week_monday: The Monday of the current week; its timezone, if any, is reused.
     
     Returns:
         Tuple of (parsed datetime, None) if successful, or (None, error message) if parsing fails.
     """
-    match = re.match(r"^\s*([A-Za-z]+)\s+(\d{1,2}):(\d{2})\s*([AaPp][Mm])\s*$", input_str)
+    match = DAY_TIME_PATTERN.match(input_str)
     if not match:
         return None, "Sorry, I didn't understand. Please use format like 'Wed 7:30 PM'."
     
@@ -42,124 +47,191 @@ def _parse_day_time_input(input_str: str, week_monday: datetime) -> Tuple[dateti
         hour += 12
     minute = int(mm)
     
-    planned_local = week_monday + timedelta(days=day_idx)
-    planned_local = planned_local.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    planned_local = planned_local.replace(tzinfo=get_local_tz())
+    # week_start_end_local() already resolved the zone once for this command
+    planned_local = (week_monday + timedelta(days=day_idx)).replace(
+        hour=hour, minute=minute, second=0, microsecond=0, tzinfo=week_monday.tzinfo or get_local_tz()
+    )
     
     return planned_local, None
 
 
+def _week_range_label(monday: datetime, sunday: datetime) -> str:
+    """Header text such as 'Oct 13 – Oct 19 (EDT)' for the given week (monday must be aware)."""
+    # Every tzinfo implements tzname(); the aware Monday answers without a zone lookup
+    tz_name = monday.tzname() or ''
+    return f"{monday.strftime('%b %d')} – {sunday.strftime('%b %d')} ({tz_name})"
+
+
+def _format_due(due_at: str | None) -> str:
+    """Due date in local time, or the stored value if it cannot be parsed."""
+    if not due_at:
+        return "No due date"
+    try:
+        return format_local(due_at, _DUE_FORMAT)
+    except (ValueError, TypeError):
+        return due_at  # fallback if format is invalid
+
+
+def _course_label(course_name: str, course_code: str | None) -> str:
+    """'CODE: Name' when the course has a code, otherwise just the name."""
+    return f"{course_code}: {course_name}" if course_code else course_name
+
+
+def _listing_entry(name: str, course_label: str, due: str) -> str:
+    """One assignment in a weekly listing."""
+    return f"📚 **{name}** — *{course_label}*\n🕓 Due: `{due}`"
+
+
+def _format_assignment_entries(assignments) -> list[str]:
+    """One listing entry per (name, due_at, course_name, course_code) row."""
+    return [
+        _listing_entry(name, _course_label(course_name, course_code), _format_due(due_at))
+        for name, due_at, course_name, course_code in assignments
+    ]
+
+
+def _pack_messages(parts: list[str], sep: str = "\n\n", limit: int = _MESSAGE_LIMIT) -> list[str]:
+    """
+    Join parts into as few messages as possible without going over limit, so
+    a listing costs one Discord request per ~1900 characters rather than one
+    per item (or a rejected oversized message).
+    """
+    messages: list[str] = []
+    current = ""
+    for part in parts:
+        if current and len(current) + len(sep) + len(part) > limit:
+            messages.append(current)
+            current = part
+        else:
+            current = f"{current}{sep}{part}" if current else part
+    if current:
+        messages.append(current)
+    return messages
+
+
 async def send_weekly_assignments_to_channel(channel: discord.TextChannel) -> None:
     """
     Sends weekly assignments to a specific Discord channel without interactive scheduling.
     Used for automated Monday morning notifications.
     """
-    # 1. Determine current week's Monday (00:00:00)
-    today = datetime.now()
-    monday = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=today.weekday())
-    sunday = monday + timedelta(days=6)
+    # 1. Determine current week's Monday (00:00:00) and Sunday
+    monday, sunday = week_start_end_local()
 
     # 2. Query the DB for assignments due this week
     assignments = await get_assignments_for_week(monday)
 
     # 3. Format date range (for message header)
-    tz = get_local_tz()
-    week_range = f"{monday.strftime('%b %d')} – {sunday.strftime('%b %d')} ({tz.tzname(None) if hasattr(tz, 'tzname') else ''})"
+    week_range = _week_range_label(monday, sunday)
 
     # 4. Format the output
     if not assignments:
         await channel.send(f"🎉 No assignments due for **{week_range}** — you're all caught up!")
         return
 
-    # Build a neat message
-    lines = []
-    for name, due_at, course_name, course_code in assignments:
-        # Convert due date to readable format
-        try:
-            due = format_local(due_at, "%a %b %d, %I:%M %p")
-        except (ValueError, TypeError):
-            due = due_at  # fallback if format is invalid
-
-        course_label = f"{course_code}: {course_name}" if course_code else course_name
-        lines.append(f"📚 **{name}** — *{course_label}*\n🕓 Due: `{due}`")
-
-    message = f"📆 **Assignments due this week ({week_range}):**\n\n" + "\n\n".join(lines)
-    message += "\n\n💡 Use `!thisweek` to schedule work times for these assignments!"
-
-    await channel.send(message)
+    header = f"📆 **Assignments due this week ({week_range}):**"
+    footer = "💡 Use `!thisweek` to schedule work times for these assignments!"
+    for message in _pack_messages([header, *_format_assignment_entries(assignments), footer]):
+        await channel.send(message)
 
 
 async def send_weekly_assignments(ctx: discord.ext.commands.Context) -> None:
     """List assignments due this week with interactive scheduling."""
-    # Determine current week's Monday (00:00:00)
-    today = datetime.now()
-    monday = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=today.weekday())
-    sunday = monday + timedelta(days=6)
+    # Determine current week's Monday (00:00:00) and Sunday
+    monday, sunday = week_start_end_local()
 
-    # Query the DB for assignments due this week
-    assignments = await get_assignments_for_week(monday)
+    # Query the DB for assignments due this week; the IDs are needed for
+    # scheduling, so one query serves both the listing and the prompts
+    rows = await get_assignments_for_week_with_ids(monday)
 
     # Format date range (for message header)
-    tz = get_local_tz()
-    tz_name = tz.tzname(None) if hasattr(tz, 'tzname') else ''
-    week_range = f"{monday.strftime('%b %d')} – {sunday.strftime('%b %d')} ({tz_name})"
+    week_range = _week_range_label(monday, sunday)
 
     # Format the output
-    if not assignments:
+    if not rows:
         await ctx.send(f"🎉 No assignments due for **{week_range}** — you're all caught up!")
         return
 
-    # Build a neat message
-    lines = []
-    for name, due_at, course_name, course_code in assignments:
-        try:
-            due = format_local(due_at, "%a %b %d, %I:%M %p")
-        except (ValueError, TypeError):
-            due = due_at  # fallback if format is invalid
-
-        course_label = f"{course_code}: {course_name}" if course_code else course_name
-        lines.append(f"📚 **{name}** — *{course_label}*\n🕓 Due: `{due}`")
-
-    message = f"📆 **Assignments due this week ({week_range}):**\n\n" + "\n\n".join(lines)
-
-    await ctx.send(message)
-
-    # Interactive scheduling
-    await ctx.send("Let's schedule time to work on each assignment now. Please reply with a day/time like 'Wed 7:30 PM'. Type 'stop' to cancel the scheduling process.")
+    # Label and due text are formatted once and reused by the scheduling prompts
+    entries = [
+        (aid, cid, aname, _course_label(cname, ccode), _format_due(due_at))
+        for aid, cid, aname, due_at, cname, ccode in rows
+    ]
+
+    header = f"📆 **Assignments due this week ({week_range}):**"
+    # Interactive scheduling instructions ride along with the listing
+    intro = (
+        "Let's schedule time to work on each assignment now. Please reply with a day/time like 'Wed 7:30 PM', "
+        "or answer several at once with one day/time per line in the order listed. "
+        "Type 'stop' to cancel the scheduling process."
+    )
+    listing = [_listing_entry(aname, label, due) for _, _, aname, label, due in entries]
+    for message in _pack_messages([header, *listing, intro]):
+        await ctx.send(message)
 
     def check_author(m):
         return m.author == ctx.author and m.channel == ctx.channel
 
-    # Fetch assignments with IDs for scheduling
-    rows = await get_assignments_for_week_with_ids(monday)
-
-    for aid, cid, aname, due_at, cname, ccode in rows:
-        due_friendly = format_local(due_at, "%a %b %d, %I:%M %p") if due_at else "No due date"
-        label = f"{ccode}: {cname}" if ccode else cname
-        await ctx.send(f"Plan time for: {aname} — {label} (due {due_friendly})\nFormat: Mon/Tue/... HH:MM AM/PM. Type 'stop' to cancel.")
-
-        while True:
-            try:
-                m = await ctx.bot.wait_for('message', timeout=SCHEDULING_TIMEOUT, check=check_author)
-            except TimeoutError:
-                # Timeout: keep prompting until provided
-                await ctx.send("I didn't get a response. Please provide a day/time (e.g., 'Wed 7:30 PM') or type 'stop'.")
-                continue
-            
-            content = m.content.strip()
-            if content.lower() in ("stop", "quit"):
-                await ctx.send("Scheduling cancelled. You can run !thisweek again to reschedule.")
-                return
-
-            # Parse time input
-            planned_local, error = _parse_day_time_input(content, monday)
-            if error:
-                await ctx.send(error)
-                continue
-            
-            # Save to database
-            planned_utc_iso = to_utc_iso_z(planned_local)
-            await upsert_study_plan(str(ctx.author.id), cid, aid, planned_utc_iso)
-            await ctx.send(f"Saved plan for {aname} on {planned_local.strftime('%a %b %d at %I:%M %p')}.")
-            break
-
+    user_id = str(ctx.author.id)
+
+    # Lines of the latest reply not yet used; a multi-line reply schedules
+    # several assignments with one round trip
+    pending_lines: list[str] = []
+    # Plans parsed from the current reply, written together (one transaction)
+    # before waiting for the next reply so an answer is never only in memory
+    planned_rows: list[tuple] = []
+    confirmations: list[str] = []
+
+    async def save_planned_rows():
+        nonlocal planned_rows, confirmations
+        if planned_rows:
+            await upsert_study_plans(planned_rows)
+            notes, planned_rows, confirmations = confirmations, [], []
+            # Confirm only what was just written, right after the reply it came from
+            await ctx.send("\n".join(notes))
+
+    timeouts = 0
+    try:
+        for aid, cid, aname, label, due_friendly in entries:
+            prompted = False
+            while True:
+                if not pending_lines:
+                    await save_planned_rows()
+                    if not prompted:
+                        await ctx.send(f"Plan time for: {aname} — {label} (due {due_friendly})\nFormat: Mon/Tue/... HH:MM AM/PM. Type 'stop' to cancel.")
+                        prompted = True
+                    try:
+                        m = await ctx.bot.wait_for('message', timeout=SCHEDULING_TIMEOUT, check=check_author)
+                    except TimeoutError:
+                        # Give up after a few silent prompts rather than waiting forever
+                        timeouts += 1
+                        if timeouts >= SCHEDULING_MAX_TIMEOUTS:
+                            await ctx.send("Timed out waiting for a response. You can run !thisweek again to finish scheduling.")
+                            return
+                        await ctx.send("I didn't get a response. Please provide a day/time (e.g., 'Wed 7:30 PM') or type 'stop'.")
+                        continue
+                    timeouts = 0
+                    pending_lines = [line.strip() for line in m.content.splitlines() if line.strip()] or [""]
+
+                content = pending_lines.pop(0)
+                if content.lower() in ("stop", "quit"):
+                    await save_planned_rows()
+                    await ctx.send("Scheduling cancelled. You can run !thisweek again to reschedule.")
+                    return
+
+                # Parse time input
+                planned_local, error = _parse_day_time_input(content, monday)
+                if error:
+                    # Later lines were meant for later assignments; wait for this one again
+                    pending_lines.clear()
+                    await ctx.send(error)
+                    continue
+
+                planned_rows.append((user_id, cid, aid, to_utc_iso_z(planned_local), None))
+                confirmations.append(f"Saved plan for {aname} on {planned_local.strftime('%a %b %d at %I:%M %p')}.")
+                break
+
+        await save_planned_rows()
+    finally:
+        # An error or disconnect partway through a reply still keeps its answers
+        if planned_rows:
+            await upsert_study_plans(planned_rows)